@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from bot.config import load_settings
@@ -5,10 +6,23 @@ from bot.logs import setup_logging
 from bot.twitch.bot import SkyBot
 
 
+def _use_uvloop() -> bool:
+    """Makes uvloop the event loop where it is installed (it has no Windows build)."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop(uvloop.new_event_loop())
+    return True
+
+
 def main() -> None:
     settings = load_settings()
     setup_logging(settings.log_level)
     logger = logging.getLogger("bot")
+    # before SkyBot: twitchio grabs the event loop in its constructor
+    if _use_uvloop():
+        logger.info("using the uvloop event loop")
     logger.info("starting bot for channels: %s", list(settings.initial_channels))
     SkyBot(settings).run()
 
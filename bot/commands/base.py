@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
@@ -30,6 +29,8 @@ class CommandSpec:
 
 
 REGISTRY: list[CommandSpec] = []
+# "<prefix>name | ..." for the visible commands, per prefix; reset on every registration
+_help_listings: dict[str, str] = {}
 
 
 def command(
@@ -39,11 +40,21 @@ def command(
 
     def decorator(handler: Handler) -> Handler:
         REGISTRY.append(CommandSpec(name=name, handler=handler, aliases=aliases, usage=usage, hidden=hidden))
+        _help_listings.clear()
         return handler
 
     return decorator
 
 
+def help_listing(prefix: str) -> str:
+    """Every visible command name with `prefix`, sorted and joined; built once per prefix."""
+    listing = _help_listings.get(prefix)
+    if listing is None:
+        names = sorted(spec.name for spec in REGISTRY if not spec.hidden)
+        listing = _help_listings[prefix] = " | ".join(f"{prefix}{name}" for name in names)
+    return listing
+
+
 # invisible characters Twitch clients (Chatterino, 7TV, ...) append to bypass
 # the duplicate-message filter; they break int()/IGN parsing if kept
 _INVISIBLE_CHARS = "\u034f\u200b\u200c\u200d\u2060\ufeff\U000e0000"
@@ -60,6 +71,9 @@ def clean_args(raw_args: str | None) -> str | None:
 class CommandContext:
     """Everything a command handler needs: the twitchio context, shared services, raw args."""
 
+    # one is built per command invocation
+    __slots__ = ("ctx", "services", "raw_args", "spec")
+
     def __init__(
         self,
         ctx: twitch_commands.Context,
@@ -87,33 +101,36 @@ class CommandContext:
         return f"{prefix}{self.spec.name}{suffix}"
 
     async def reply(self, message: str) -> None:
-        """Sends a reply with @mention after a short delay (deliberate rate-limit cushion)."""
+        """Sends a reply with @mention through the bot's chat queue (see bot.twitch.chat)."""
         text = f"@{self.author_name}, {message}"
         if len(text) > MAX_MESSAGE_LENGTH:
             text = text[: MAX_MESSAGE_LENGTH - 3] + "..."
 
         logger.info("reply in #%s: %s", self.channel_name, text)
-        await asyncio.sleep(0.3)
-        # re-fetch the channel object instead of ctx.send; ctx can go stale on busy channels.
-        # Any-cast: twitchio's @id_cache decorator hides get_channel's real signature from pyrefly
-        channel = cast("Any", self.ctx.bot).get_channel(self.channel_name)
-        if channel:
-            await channel.send(text)
-        else:
-            logger.warning("could not re-fetch channel %s, falling back to ctx.send", self.channel_name)
-            await self.ctx.send(text)
+        # Any-cast: the chat sender lives on SkyBot, not twitchio's Bot
+        await cast("Any", self.ctx.bot).chat.send(self.channel_name, text, self.ctx.send)
 
     def parse_ign_profile(self) -> tuple[str | None, str | None]:
         """Parses '<ign> [profile]' from the raw args; both parts are optional."""
         if not self.raw_args:
             return None, None
-        parts = self.raw_args.split()
+        # at most three parts: a third one only needs to exist to be rejected
+        parts = self.raw_args.split(maxsplit=2)
         if len(parts) > 2:
             raise UserError(f"Too many arguments. Usage: {self.usage}")
         ign = parts[0]
         profile_name = parts[1] if len(parts) > 1 else None
         return ign, profile_name
 
+    @property
+    def first_arg(self) -> str | None:
+        """The first word of the raw args, for '<ign>' commands that ignore anything after it."""
+        return self.raw_args.split(maxsplit=1)[0] if self.raw_args else None
+
+    def target_ign(self) -> str:
+        """The IGN an '<ign>' command is about: the first arg, else the author's linked IGN or name."""
+        return self.services.profiles.resolve_ign(self.first_arg, self.author_name)
+
     async def fetch_profile(self, *, use_cache: bool = True) -> PlayerProfile:
         ign, profile_name = self.parse_ign_profile()
         return await self.fetch_profile_for(ign, profile_name, use_cache=use_cache)
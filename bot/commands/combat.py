@@ -3,6 +3,15 @@ from bot.constants import ESSENCE_TYPES, KUUDRA_TIER_POINTS, KUUDRA_TIERS_ORDER,
 from bot.errors import UserError
 from bot.format import format_price
 from bot.hypixel.leveling import calculate_slayer_level
+from bot.hypixel.profiles import dig
+
+_SLAYER_BOSSES = tuple((key, key.capitalize()) for key in SLAYER_BOSS_KEYS)
+_ESSENCES = tuple((key, key.capitalize()) for key in ESSENCE_TYPES)
+# (API key, display name, score points) per tier, in display order
+_KUUDRA_TIERS = tuple(
+    (tier, "basic" if tier == "none" else tier, KUUDRA_TIER_POINTS.get(tier, 0))
+    for tier in KUUDRA_TIERS_ORDER
+)
 
 
 @command("kuudra", usage="<ign> [profile]")
@@ -15,34 +24,29 @@ async def kuudra(cc: CommandContext) -> None:
     if not completed_tiers:
         raise UserError(f"No Kuudra completions recorded for {p.ign} in profile {p.profile_name}.")
 
-    completions: list[str] = []
-    total_score = 0
-    for tier in KUUDRA_TIERS_ORDER:
-        count = completed_tiers.get(tier, 0)
-        tier_name = "basic" if tier == "none" else tier
-        completions.append(f"{tier_name} {count}")
-        total_score += count * KUUDRA_TIER_POINTS.get(tier, 0)
+    counts = [(name, completed_tiers.get(tier, 0), points) for tier, name, points in _KUUDRA_TIERS]
+    completions = ", ".join(f"{name} {count}" for name, count, _ in counts)
+    total_score = sum(count * points for _, count, points in counts)
 
     await cc.reply(
-        f"{p.ign}'s Kuudra completions in profile '{p.profile_name}': "
-        f"{', '.join(completions)} | Score: {total_score:,}"
+        f"{p.ign}'s Kuudra completions in profile '{p.profile_name}': {completions} | Score: {total_score:,}"
     )
 
 
 @command("slayer", aliases=("slayers",), usage="<ign> [profile]")
 async def slayer(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    slayer_bosses = p.member.get("slayer", {}).get("slayer_bosses", {})
+    slayer_bosses = dig(p.member, "slayer", "slayer_bosses", default={})
     if not slayer_bosses:
         raise UserError(f"'{p.ign}' has no slayer data in profile '{p.profile_name}'.")
 
     total_xp = 0
     levels: list[str] = []
-    for boss_key in SLAYER_BOSS_KEYS:
-        xp = slayer_bosses.get(boss_key, {}).get("xp", 0)
+    for boss_key, label in _SLAYER_BOSSES:
+        xp = dig(slayer_bosses, boss_key, "xp", default=0)
         total_xp += xp
         level = calculate_slayer_level(cc.services.leveling, xp, boss_key)
-        levels.append(f"{boss_key.capitalize()} {level} ({format_price(xp)} XP)")
+        levels.append(f"{label} {level} ({format_price(xp)} XP)")
 
     await cc.reply(
         f"{p.ign}'s Slayers (Profile: '{p.profile_name}'): "
@@ -53,12 +57,12 @@ async def slayer(cc: CommandContext) -> None:
 @command("essence", usage="<ign> [profile]")
 async def essence(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    all_essence = p.member.get("currencies", {}).get("essence", {})
+    all_essence = dig(p.member, "currencies", "essence", default={})
     if not all_essence:
         raise UserError(f"No essence data found for '{p.ign}' in profile '{p.profile_name}'.")
 
     amounts = [
-        f"{essence_type.capitalize()}: {format_price(all_essence.get(essence_type, {}).get('current', 0))}"
-        for essence_type in ESSENCE_TYPES
+        f"{label}: {format_price(dig(all_essence, essence_type, 'current', default=0))}"
+        for essence_type, label in _ESSENCES
     ]
     await cc.reply(f"{p.ign} (Profile: '{p.profile_name}'): {' | '.join(amounts)}")
@@ -1,3 +1,4 @@
+import asyncio
 import math
 from dataclasses import dataclass
 
@@ -14,9 +15,12 @@ from bot.constants import (
 )
 from bot.errors import UserError
 from bot.hypixel.leveling import calculate_class_level, calculate_dungeon_level, get_xp_for_target_level
+from bot.hypixel.profiles import dig
 
-FLOORS = ("m6", "m7")
-MAX_SIM_ITERATIONS = 100_000
+# base XP per completion, by floor
+_CLASS_XP_PER_RUN = {"m6": BASE_M6_CLASS_XP, "m7": BASE_M7_CLASS_XP}
+_CATA_XP_PER_RUN = {"m6": BASE_M6_XP, "m7": BASE_M7_XP}
+FLOORS = frozenset(_CATA_XP_PER_RUN)
 
 _CLASS_ALIASES = {
     "archer": ["arch", "a"],
@@ -30,7 +34,7 @@ CLASS_ALIAS_TO_CANONICAL = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimArgs:
     ign: str | None
     profile_name: str | None
@@ -67,17 +71,16 @@ def parse_sim_args(cc: CommandContext, *, with_class: bool = False) -> SimArgs:
 
     for part in remaining:
         part_lower = part.lower()
-        if with_class and part_lower in CLASS_ALIAS_TO_CANONICAL and class_name is None:
-            class_name = CLASS_ALIAS_TO_CANONICAL[part_lower]
-        elif part_lower in FLOORS and floor is None:
+        canonical_class = CLASS_ALIAS_TO_CANONICAL.get(part_lower) if with_class else None
+        is_floor = part_lower in FLOORS
+        is_target = _is_target(part)
+        if canonical_class is not None and class_name is None:
+            class_name = canonical_class
+        elif is_floor and floor is None:
             floor = part_lower
-        elif _is_target(part) and target is None:
+        elif is_target and target is None:
             target = int(part)
-        elif profile_name is None and not (
-            part_lower in FLOORS
-            or _is_target(part)
-            or (with_class and part_lower in CLASS_ALIAS_TO_CANONICAL)
-        ):
+        elif profile_name is None and canonical_class is None and not is_floor and not is_target:
             profile_name = part
         else:
             unidentified.append(part)
@@ -92,30 +95,42 @@ def parse_sim_args(cc: CommandContext, *, with_class: bool = False) -> SimArgs:
 def simulate_class_runs(
     needs: dict[str, float], active_gain: float, passive_gain: float
 ) -> tuple[int, dict[str, int]]:
-    """Greedy simulation: each run is played actively on the bottleneck class,
-    all other classes gain passive XP. Returns (total runs, active runs per class)."""
-    total_runs = 0
-    active_runs = dict.fromkeys(needs, 0)
-    remaining = dict(needs)
+    """Fewest runs that cover every class's XP need, when each run is played actively on
+    one class and all other classes gain passive XP. Returns (total runs, active runs per class).
 
-    while remaining and total_runs < MAX_SIM_ITERATIONS:
-        total_runs += 1
-        bottleneck = max(remaining, key=lambda cn: math.ceil(remaining[cn] / active_gain))
-        active_runs[bottleneck] += 1
-
-        next_remaining: dict[str, float] = {}
-        for class_name, needed in remaining.items():
-            gained = active_gain if class_name == bottleneck else passive_gain
-            if needed - gained > 0:
-                next_remaining[class_name] = needed - gained
-        remaining = next_remaining
+    With R runs in total, class i must be played in k_i = ceil((need_i - R * passive) /
+    (active - passive)) of them; R is the smallest value with sum(k_i) <= R, found by
+    bisection instead of simulating run by run.
+    """
+    if not needs:
+        return 0, {}
+    bonus = active_gain - passive_gain
+
+    def active_needed(total_runs: int) -> dict[str, int]:
+        return {
+            name: max(0, math.ceil((needed - total_runs * passive_gain) / bonus))
+            for name, needed in needs.items()
+        }
+
+    # playing every class actively until done is always enough
+    low, high = 0, sum(math.ceil(needed / active_gain) for needed in needs.values())
+    while low < high:
+        mid = (low + high) // 2
+        if sum(active_needed(mid).values()) <= mid:
+            high = mid
+        else:
+            low = mid + 1
 
-    return total_runs, active_runs
+    active_runs = active_needed(low)
+    # runs no class strictly needs go to the class with the most XP left
+    spare = low - sum(active_runs.values())
+    if spare:
+        active_runs[max(needs, key=needs.__getitem__)] += spare
+    return low, active_runs
 
 
 async def _is_derpy_active(cc: CommandContext) -> bool:
-    election = await cc.services.hypixel.get_election()
-    mayor = election.get("mayor") if election else None
+    mayor = await cc.services.hypixel.get_mayor()
     return bool(mayor and mayor.get("name") == "Derpy")
 
 
@@ -124,14 +139,16 @@ async def rtca(cc: CommandContext) -> None:
     sim_args = parse_sim_args(cc)
     target = sim_args.target if sim_args.target is not None else 50
 
-    p = await cc.fetch_profile_for(sim_args.ign, sim_args.profile_name, use_cache=False)
+    p, derpy = await asyncio.gather(
+        cc.fetch_profile_for(sim_args.ign, sim_args.profile_name, use_cache=False), _is_derpy_active(cc)
+    )
     dungeons_data = p.member.get("dungeons", {})
     player_classes = dungeons_data.get("player_classes")
     if player_classes is None:
         raise UserError(f"'{p.ign}' has no class data in profile '{p.profile_name}'.")
     selected_class = (dungeons_data.get("selected_dungeon_class") or "").lower()
 
-    class_xps = {cn: player_classes.get(cn, {}).get("experience", 0) for cn in CLASS_NAMES}
+    class_xps = {cn: dig(player_classes, cn, "experience", default=0) for cn in CLASS_NAMES}
     class_levels = {cn: calculate_class_level(cc.services.leveling, xp) for cn, xp in class_xps.items()}
     current_ca = sum(class_levels.values()) / len(CLASS_NAMES)
 
@@ -141,8 +158,7 @@ async def rtca(cc: CommandContext) -> None:
             f"the target Class Average {target}."
         )
 
-    derpy = await _is_derpy_active(cc)
-    base_xp = BASE_M6_CLASS_XP if sim_args.floor == "m6" else BASE_M7_CLASS_XP
+    base_xp = _CLASS_XP_PER_RUN[sim_args.floor]
     floor_name = sim_args.floor.upper()
     xp_per_run = base_xp * (DERPY_XP_MULTIPLIER if derpy else 1.0) * CLASS_XP_BUFF_FACTOR
 
@@ -160,9 +176,8 @@ async def rtca(cc: CommandContext) -> None:
     sorted_counts = sorted(((cn, n) for cn, n in active_runs.items() if n > 0), key=lambda item: -item[1])
 
     def format_class_count(cn: str, count: int) -> str:
-        marker_prefix = "🔸 " if cn == selected_class else ""
-        marker_suffix = " 🔸" if cn == selected_class else ""
-        return f"{marker_prefix}{cn.capitalize()}: {count}{marker_suffix}"
+        label = f"{cn.capitalize()}: {count}"
+        return f"🔸 {label} 🔸" if cn == selected_class else label
 
     breakdown = " | ".join(format_class_count(cn, count) for cn, count in sorted_counts)
     message = (
@@ -179,7 +194,9 @@ async def rtca(cc: CommandContext) -> None:
 async def rtcl(cc: CommandContext) -> None:
     sim_args = parse_sim_args(cc, with_class=True)
 
-    p = await cc.fetch_profile_for(sim_args.ign, sim_args.profile_name, use_cache=False)
+    p, derpy = await asyncio.gather(
+        cc.fetch_profile_for(sim_args.ign, sim_args.profile_name, use_cache=False), _is_derpy_active(cc)
+    )
     dungeons_data = p.member.get("dungeons", {})
     player_classes = dungeons_data.get("player_classes")
     if player_classes is None:
@@ -198,7 +215,7 @@ async def rtcl(cc: CommandContext) -> None:
         class_key = active_class.lower()
 
     class_display = class_key.capitalize()
-    current_xp = player_classes.get(class_key, {}).get("experience", 0)
+    current_xp = dig(player_classes, class_key, "experience", default=0)
     current_level = calculate_class_level(cc.services.leveling, current_xp)
 
     if sim_args.target is not None:
@@ -211,7 +228,7 @@ async def rtcl(cc: CommandContext) -> None:
         if target < 1:
             raise UserError("Target level must be at least 1.")
     else:
-        target = math.floor(current_level) + 1
+        target = int(current_level) + 1
 
     if current_level >= target:
         raise UserError(
@@ -219,8 +236,7 @@ async def rtcl(cc: CommandContext) -> None:
             f"has already reached or surpassed the target level {target}."
         )
 
-    derpy = await _is_derpy_active(cc)
-    base_xp = BASE_M6_CLASS_XP if sim_args.floor == "m6" else BASE_M7_CLASS_XP
+    base_xp = _CLASS_XP_PER_RUN[sim_args.floor]
     floor_name = sim_args.floor.upper()
     xp_per_run = base_xp * (DERPY_XP_MULTIPLIER if derpy else 1.0)
 
@@ -244,15 +260,15 @@ async def rtcl(cc: CommandContext) -> None:
 async def runs_till_cata(cc: CommandContext) -> None:
     sim_args = parse_sim_args(cc)
 
-    p = await cc.fetch_profile_for(sim_args.ign, sim_args.profile_name)
-    catacombs = p.member.get("dungeons", {}).get("dungeon_types", {}).get("catacombs", {})
-    current_xp = catacombs.get("experience", 0)
+    p, derpy = await asyncio.gather(
+        cc.fetch_profile_for(sim_args.ign, sim_args.profile_name), _is_derpy_active(cc)
+    )
+    current_xp = dig(p.member, "dungeons", "dungeon_types", "catacombs", "experience", default=0)
     current_level = calculate_dungeon_level(cc.services.leveling, current_xp)
 
     if sim_args.target is None:
-        target = math.ceil(current_level)
-        if target == math.floor(current_level):
-            target += 1
+        # the next whole level, whether or not the current one has progress
+        target = int(current_level) + 1
     else:
         target = sim_args.target
 
@@ -260,8 +276,7 @@ async def runs_till_cata(cc: CommandContext) -> None:
     if xp_needed <= 0:
         raise UserError(f"{p.ign} has already reached Catacombs level {target}!")
 
-    derpy = await _is_derpy_active(cc)
-    base_xp = BASE_M6_XP if sim_args.floor == "m6" else BASE_M7_XP
+    base_xp = _CATA_XP_PER_RUN[sim_args.floor]
     floor_name = sim_args.floor.upper()
     xp_per_run = base_xp * DERPY_XP_MULTIPLIER if derpy else base_xp
 
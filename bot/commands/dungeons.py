@@ -1,26 +1,29 @@
+import functools
 import math
-import re
 import time
+from typing import Any
 
 from bot.commands.base import CommandContext, command
 from bot.constants import CLASS_NAMES
 from bot.errors import UserError
+from bot.format import strip_color_codes
 from bot.hypixel.leveling import calculate_class_level, calculate_dungeon_level
+from bot.hypixel.profiles import dig
+
+_CLASS_LABELS = tuple(name.capitalize() for name in CLASS_NAMES)
 
 
 @command("dungeon", aliases=("dungeons", "cata"), usage="<ign> [profile]")
 async def dungeon(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    dungeons_data = p.member.get("dungeons", {})
-    catacombs_xp = dungeons_data.get("dungeon_types", {}).get("catacombs", {}).get("experience", 0)
+    dungeons_data = p.member.get("dungeons") or {}
+    catacombs_xp = dig(dungeons_data, "dungeon_types", "catacombs", "experience", default=0)
     level = calculate_dungeon_level(cc.services.leveling, catacombs_xp)
 
     selected_class = dungeons_data.get("selected_dungeon_class")
     class_xp = 0
     if selected_class:
-        class_xp = (
-            dungeons_data.get("player_classes", {}).get(selected_class.lower(), {}).get("experience", 0)
-        )
+        class_xp = dig(dungeons_data, "player_classes", selected_class.lower(), "experience", default=0)
 
     if selected_class and class_xp > 0:
         class_level = calculate_class_level(cc.services.leveling, class_xp)
@@ -38,18 +41,19 @@ async def dungeon(cc: CommandContext) -> None:
 @command("classaverage", aliases=("ca",), usage="<ign> [profile]")
 async def class_average(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    player_classes = p.member.get("dungeons", {}).get("player_classes")
+    player_classes = dig(p.member, "dungeons", "player_classes")
     if player_classes is None:
         raise UserError(f"No class data found for {p.ign} in profile '{p.profile_name}'.")
 
-    levels = {
-        name.capitalize(): calculate_class_level(
-            cc.services.leveling, player_classes.get(name, {}).get("experience", 0)
-        )
+    leveling = cc.services.leveling
+    levels = [
+        calculate_class_level(leveling, dig(player_classes, name, "experience", default=0))
         for name in CLASS_NAMES
-    }
-    average = sum(levels.values()) / len(levels)
-    levels_str = " | ".join(f"{name} {level:.2f}" for name, level in levels.items())
+    ]
+    average = sum(levels) / len(levels)
+    levels_str = " | ".join(
+        f"{label} {level:.2f}" for label, level in zip(_CLASS_LABELS, levels, strict=True)
+    )
     await cc.reply(
         f"{p.ign}'s class levels in profile '{p.profile_name}': {levels_str} | Average: {average:.2f}"
     )
@@ -58,7 +62,7 @@ async def class_average(cc: CommandContext) -> None:
 @command("secrets", usage="<ign> [profile]")
 async def secrets(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    found = p.member.get("dungeons", {}).get("secrets", 0)
+    found = dig(p.member, "dungeons", "secrets", default=0)
     formatted = f"{found:,}".replace(",", ".")
     await cc.reply(f"{p.ign} has {formatted} secrets")
 
@@ -80,34 +84,53 @@ def _format_run_type(dungeon_type: str, dungeon_tier: str | int) -> str:
     return f"{dungeon_type.capitalize()} {dungeon_tier}"
 
 
+# participant strings repeat across refreshes and channels; the parse is pure
+@functools.lru_cache(maxsize=512)
 def _parse_participant(raw_display_name: str, target_ign_lower: str) -> str | None:
     """'§bSteve: §eMage§b (§e42§b)' -> 'Steve (Mage 42)'; None for the target player."""
-    cleaned = re.sub(r"§[0-9a-fk-or]", "", raw_display_name)
-    username, _, class_info = cleaned.partition(":")
-    username = username.strip()
+    # split first so the target player is rejected before the class info is cleaned
+    raw_username, _, raw_class_info = raw_display_name.partition(":")
+    username = strip_color_codes(raw_username).strip()
     if not username or username.lower() == target_ign_lower:
         return None
 
-    final_class, final_level = "Unknown", "?"
-    class_match = re.match(r"^([a-zA-Z]+)", class_info.strip())
-    if class_match:
-        final_class = class_match.group(1)
-    level_match = re.search(r"\((\d+)\)", class_info)
-    if level_match:
-        final_level = level_match.group(1)
+    class_info = strip_color_codes(raw_class_info).strip()
+    end = 0
+    while end < len(class_info) and class_info[end].isascii() and class_info[end].isalpha():
+        end += 1
+    final_class = class_info[:end] or "Unknown"
+
+    _, open_paren, after_paren = class_info.partition("(")
+    level, close_paren, _ = after_paren.partition(")")
+    final_level = level if open_paren and close_paren and level.isdigit() else "?"
     return f"{username} ({final_class} {final_level})"
 
 
+def _parse_participants(participants: list[Any], target_ign_lower: str) -> list[str]:
+    """Teammate labels for a run's participants; skips the target player and malformed entries."""
+    names = (participant.get("display_name") for participant in participants if isinstance(participant, dict))
+    parsed = (_parse_participant(name, target_ign_lower) for name in names if name and isinstance(name, str))
+    return [teammate for teammate in parsed if teammate]
+
+
+def _completion_ts(run: dict[str, Any]) -> float:
+    """The run's completion time in ms, or 0 when it is missing or not a number."""
+    ts = run.get("completion_ts")
+    return ts if isinstance(ts, int | float) else 0
+
+
+def _latest_run(runs: list[Any]) -> dict[str, Any] | None:
+    return max((run for run in runs if isinstance(run, dict)), key=_completion_ts, default=None)
+
+
 @command("currdungeon", usage="<ign> [profile]")
 async def current_dungeon(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    treasures = p.member.get("dungeons", {}).get("treasures") or {}
-    runs = [run for run in treasures.get("runs", []) if isinstance(run, dict)]
-    if not runs:
+    latest_run = _latest_run(dig(p.member, "dungeons", "treasures", "runs") or [])
+    if latest_run is None:
         raise UserError(f"'{p.ign}' has no recorded dungeon runs in profile '{p.profile_name}'.")
 
-    latest_run = max(runs, key=lambda run: run.get("completion_ts", 0))
-    completion_ts = latest_run.get("completion_ts", 0)
+    completion_ts = _completion_ts(latest_run)
     if not completion_ts:
         raise UserError(f"Could not find a valid latest run for '{p.ign}' in profile '{p.profile_name}'.")
 
@@ -118,12 +141,7 @@ async def current_dungeon(cc: CommandContext) -> None:
     run_info = _format_run_type(
         latest_run.get("dungeon_type", "Unknown Type"), latest_run.get("dungeon_tier", "?")
     )
-    teammates = [
-        parsed
-        for participant in latest_run.get("participants", [])
-        if isinstance(participant, dict) and participant.get("display_name")
-        if (parsed := _parse_participant(participant["display_name"], p.ign.lower()))
-    ]
+    teammates = _parse_participants(latest_run.get("participants", []), p.ign.lower())
     teammates_str = ", ".join(teammates) if teammates else "No other participants listed"
     await cc.reply(
         f"{p.ign}'s last run was {run_info} finished {_format_relative_time(seconds_since)}. "
@@ -4,7 +4,8 @@ import time
 from bot.commands.base import CommandContext, command
 from bot.constants import MAX_MESSAGE_LENGTH
 from bot.errors import UserError
-from bot.format import format_number, format_price
+from bot.format import format_number, format_price, strip_color_codes
+from bot.hypixel.profiles import dig
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +15,9 @@ TWO_WEEKS_SECONDS = 14 * 24 * 3600
 @command("bank", aliases=("purse", "money"), usage="<ign> [profile]")
 async def bank(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    bank_balance = p.profile.get("banking", {}).get("balance", 0.0)
-    purse_balance = p.member.get("currencies", {}).get("coin_purse", 0.0)
-    personal_bank = p.member.get("profile", {}).get("bank_account")
+    bank_balance = dig(p.profile, "banking", "balance", default=0.0)
+    purse_balance = dig(p.member, "currencies", "coin_purse", default=0.0)
+    personal_bank = dig(p.member, "profile", "bank_account")
 
     parts = [f"{p.ign}'s Bank: {bank_balance:,.0f}", f"Purse: {purse_balance:,.0f}"]
     if personal_bank is not None:
@@ -35,9 +36,9 @@ async def networth(cc: CommandContext) -> None:
         raise UserError(f"Couldn't calculate networth for {p.ign}: Missing profile ID")
 
     museum = await cc.services.hypixel.get_museum(p.uuid, p.profile_id)
-    museum_member = museum.get("members", {}).get(p.uuid) if museum else None
+    museum_member = dig(museum, "members", p.uuid)
 
-    bank_balance = p.profile.get("banking", {}).get("balance", 0)
+    bank_balance = dig(p.profile, "banking", "balance", default=0)
     result = await cc.services.networth.calculate(p.uuid, p.profile, museum_member, bank_balance)
     if not result or not result.get("success"):
         error_msg = result.get("error", "Unknown error") if result else "Failed to calculate networth"
@@ -76,8 +77,7 @@ async def networth(cc: CommandContext) -> None:
 
 @command("auctions", aliases=("ah",), usage="<ign>")
 async def auctions(cc: CommandContext) -> None:
-    ign_arg = cc.raw_args.split()[0] if cc.raw_args else None
-    target_ign = cc.services.profiles.resolve_ign(ign_arg, cc.author_name)
+    target_ign = cc.target_ign()
 
     uuid = await cc.services.mojang.get_uuid(target_ign)
     if not uuid:
@@ -103,16 +103,16 @@ async def auctions(cc: CommandContext) -> None:
 
     message_prefix = f"{target_ign}'s Auctions: "
     shown: list[str] = []
-    current_length = len(message_prefix)
+    # characters left for the auction list; the first entry has no " | " before it
+    budget = MAX_MESSAGE_LENGTH - len(message_prefix) + 3
     for auction in recent:
-        item_name = auction.get("item_name", "Unknown Item").replace("§.", "")
+        item_name = strip_color_codes(auction.get("item_name", "Unknown Item"))
         highest_bid = auction.get("highest_bid_amount", 0) or auction.get("starting_bid", 0)
         auction_str = f"{item_name} {format_price(highest_bid)}"
-        separator_length = 3 if shown else 0
-        if current_length + separator_length + len(auction_str) > MAX_MESSAGE_LENGTH:
+        budget -= 3 + len(auction_str)
+        if budget < 0:
             break
         shown.append(auction_str)
-        current_length += separator_length + len(auction_str)
 
     if not shown:
         raise UserError(f"Could not format any auctions for '{target_ign}' within the character limit.")
@@ -1,7 +1,7 @@
 import random
 import string
 
-from bot.commands.base import REGISTRY, CommandContext, command
+from bot.commands.base import CommandContext, command, help_listing
 from bot.errors import UserError
 
 
@@ -41,7 +41,5 @@ async def dongo(cc: CommandContext) -> None:
 
 @command("help", aliases=("info",))
 async def help_command(cc: CommandContext) -> None:
-    prefix = cc.ctx.prefix or "#"
-    names = sorted(spec.name for spec in REGISTRY if not spec.hidden)
-    listing = " | ".join(f"{prefix}{name}" for name in names)
+    listing = help_listing(cc.ctx.prefix or "#")
     await cc.reply(f"{listing} | made by Iceshadow_")
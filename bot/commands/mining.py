@@ -1,12 +1,13 @@
 from bot.commands.base import CommandContext, command
 from bot.constants import NUCLEUS_CRYSTALS
 from bot.hypixel.leveling import calculate_hotm_level
+from bot.hypixel.profiles import dig
 
 
 @command("hotm", usage="<ign> [profile]")
 async def hotm(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    hotm_xp = p.member.get("mining_core", {}).get("experience", 0.0)
+    hotm_xp = dig(p.member, "mining_core", "experience", default=0.0)
     level = calculate_hotm_level(cc.services.leveling, hotm_xp)
     await cc.reply(f"{p.ign}'s HotM level is {level:.2f} (XP: {hotm_xp:,.0f}) (Profile: '{p.profile_name}')")
 
@@ -14,7 +15,7 @@ async def hotm(cc: CommandContext) -> None:
 @command("powder", usage="<ign> [profile]")
 async def powder(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    mining_core = p.member.get("mining_core", {})
+    mining_core = p.member.get("mining_core") or {}
 
     parts: list[str] = []
     for powder_type in ("mithril", "gemstone", "glacite"):
@@ -28,6 +29,6 @@ async def powder(cc: CommandContext) -> None:
 @command("nucleus", usage="<ign> [profile]")
 async def nucleus(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    crystals = p.member.get("mining_core", {}).get("crystals", {})
-    total_placed = sum(crystals.get(key, {}).get("total_placed", 0) for key in NUCLEUS_CRYSTALS)
+    crystals = dig(p.member, "mining_core", "crystals", default={})
+    total_placed = sum(dig(crystals, key, "total_placed", default=0) for key in NUCLEUS_CRYSTALS)
     await cc.reply(f"{p.ign}'s nucleus runs: {total_placed // 5} (Profile: '{p.profile_name}')")
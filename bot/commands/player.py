@@ -57,8 +57,7 @@ async def guild(cc: CommandContext) -> None:
 
 @command("whatdoing", aliases=("wd",), usage="[username]")
 async def whatdoing(cc: CommandContext) -> None:
-    ign_arg = cc.raw_args.split()[0] if cc.raw_args else None
-    target_ign = cc.services.profiles.resolve_ign(ign_arg, cc.author_name)
+    target_ign = cc.target_ign()
 
     uuid = await cc.services.mojang.get_uuid(target_ign)
     if not uuid:
@@ -11,13 +11,14 @@ from bot.errors import UserError
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r"<.*?>")
+
 
 @command("mayor")
 async def mayor(cc: CommandContext) -> None:
-    election = await cc.services.hypixel.get_election()
-    if election is None:
+    mayor_data = await cc.services.hypixel.get_mayor()
+    if mayor_data is None:
         raise UserError("API request failed. Could not fetch election data.")
-    mayor_data = election.get("mayor")
     if not mayor_data:
         raise UserError("Could not find current mayor data in the API response.")
 
@@ -41,7 +42,7 @@ async def hypixel_status(cc: CommandContext) -> None:
         async with cc.services.session.get(HYPIXEL_STATUS_RSS_URL) as response:
             response.raise_for_status()
             rss_content = await response.text()
-    except aiohttp.ClientError as e:
+    except (TimeoutError, aiohttp.ClientError) as e:
         logger.warning("failed to fetch Hypixel status RSS: %s", e)
         raise UserError("Could not retrieve the latest Hypixel status") from None
 
@@ -52,7 +53,7 @@ async def hypixel_status(cc: CommandContext) -> None:
             raise UserError("Could not retrieve the latest Hypixel status")
         title = latest_item.findtext("title", "").strip()
         description_html = latest_item.findtext("description", "")
-        description = re.sub(r"<.*?>", "", description_html).strip()
+        description = _HTML_TAG_RE.sub("", description_html).strip()
     except ParseError as e:
         logger.warning("failed to parse Hypixel status RSS: %s", e)
         raise UserError("Could not retrieve the latest Hypixel status") from None
@@ -1,9 +1,13 @@
 from collections.abc import Iterator
 
 from bot.commands.base import CommandContext, command
-from bot.constants import AVERAGE_SKILLS_LIST
+from bot.constants import AVERAGE_SKILLS_LIST, AVERAGE_SKILLS_SET
 from bot.errors import UserError
 from bot.hypixel.leveling import calculate_skill_level
+from bot.hypixel.profiles import dig
+
+# (name, experience key, display label) per averaged skill
+_SKILLS = tuple((name, f"SKILL_{name.upper()}", name.capitalize()) for name in AVERAGE_SKILLS_LIST)
 
 
 def overflow_xp_generator(xp_table: list[int]) -> Iterator[int]:
@@ -39,15 +43,14 @@ def overflow_level(xp_table: list[int], total_xp: float) -> float:
 @command("skills", aliases=("sa",), usage="<ign> [profile]")
 async def skills(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    experience = p.member.get("player_data", {}).get("experience", {})
+    experience = dig(p.member, "player_data", "experience", default={})
 
     skill_levels: list[str] = []
     total_level = 0.0
-    for skill_name in AVERAGE_SKILLS_LIST:
-        skill_xp = experience.get(f"SKILL_{skill_name.upper()}", 0)
-        level = calculate_skill_level(cc.services.leveling, skill_xp, skill_name, p.member)
+    for skill_name, xp_key, label in _SKILLS:
+        level = calculate_skill_level(cc.services.leveling, experience.get(xp_key, 0), skill_name, p.member)
         total_level += level
-        skill_levels.append(f"{skill_name.capitalize()} {level:.2f}")
+        skill_levels.append(f"{label} {level:.2f}")
 
     average = total_level / len(AVERAGE_SKILLS_LIST)
     await cc.reply(f"{p.ign}'s skill levels (SA {average:.2f}) {' | '.join(skill_levels)}")
@@ -56,15 +59,15 @@ async def skills(cc: CommandContext) -> None:
 @command("oskill", aliases=("skillo", "oskills", "skillso", "overflow"), usage="<ign> [profile]")
 async def overflow_skills(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    experience = p.member.get("player_data", {}).get("experience", {})
+    experience = dig(p.member, "player_data", "experience", default={})
     xp_table = cc.services.leveling["xp_table"]
 
     skill_levels: list[str] = []
     total_level = 0.0
-    for skill_name in AVERAGE_SKILLS_LIST:
-        level = overflow_level(xp_table, experience.get(f"SKILL_{skill_name.upper()}", 0))
+    for _, xp_key, label in _SKILLS:
+        level = overflow_level(xp_table, experience.get(xp_key, 0))
         total_level += level
-        skill_levels.append(f"{skill_name.title()} {level:.2f}")
+        skill_levels.append(f"{label} {level:.2f}")
 
     average = total_level / len(AVERAGE_SKILLS_LIST)
     await cc.reply(f"{p.ign}'s overflow skill levels (SA {average:.2f}) {' | '.join(skill_levels)}")
@@ -75,9 +78,9 @@ async def skill_level(cc: CommandContext) -> None:
     if not cc.raw_args:
         raise UserError(f"Usage: {cc.usage}")
 
-    parts = cc.raw_args.split()
+    parts = cc.raw_args.split(maxsplit=3)
     skill_name = parts[0]
-    if skill_name.lower() not in AVERAGE_SKILLS_LIST:
+    if skill_name.lower() not in AVERAGE_SKILLS_SET:
         valid = ", ".join(s.capitalize() for s in AVERAGE_SKILLS_LIST)
         raise UserError(f"Invalid skill '{skill_name}'. Valid skills are: {valid}.")
 
@@ -87,7 +90,7 @@ async def skill_level(cc: CommandContext) -> None:
         raise UserError(f"Too many arguments. Usage: {cc.usage}")
 
     p = await cc.fetch_profile_for(ign, profile_name)
-    experience = p.member.get("player_data", {}).get("experience", {})
+    experience = dig(p.member, "player_data", "experience", default={})
     total_xp = experience.get(f"SKILL_{skill_name.upper()}", 0)
     level = overflow_level(cc.services.leveling["xp_table"], total_xp)
     await cc.reply(f"{p.ign}'s {skill_name.capitalize()} level: {level:.2f} ({total_xp:,.0f} exp)")
@@ -96,5 +99,5 @@ async def skill_level(cc: CommandContext) -> None:
 @command("sblvl", aliases=("lvl",), usage="<ign> [profile]")
 async def sblvl(cc: CommandContext) -> None:
     p = await cc.fetch_profile()
-    sb_xp = p.member.get("leveling", {}).get("experience", 0)
+    sb_xp = dig(p.member, "leveling", "experience", default=0)
     await cc.reply(f"{p.ign}'s SkyBlock level in profile '{p.profile_name}' is {sb_xp / 100.0:.2f}.")
@@ -8,7 +8,7 @@ HYPIXEL_GUILD_API_URL = "https://api.hypixel.net/v2/guild"
 HYPIXEL_STATUS_URL = "https://api.hypixel.net/status"
 HYPIXEL_STATUS_RSS_URL = "https://status.hypixel.net/history.rss"
 
-AVERAGE_SKILLS_LIST = [
+AVERAGE_SKILLS_LIST = (
     "farming",
     "mining",
     "combat",
@@ -19,13 +19,14 @@ AVERAGE_SKILLS_LIST = [
     "taming",
     "carpentry",
     "hunting",
-]
-KUUDRA_TIERS_ORDER = ["none", "hot", "burning", "fiery", "infernal"]
+)
+AVERAGE_SKILLS_SET = frozenset(AVERAGE_SKILLS_LIST)
+KUUDRA_TIERS_ORDER = ("none", "hot", "burning", "fiery", "infernal")
 KUUDRA_TIER_POINTS = {"none": 1, "hot": 2, "burning": 3, "fiery": 4, "infernal": 5}
-CLASS_NAMES = ["healer", "mage", "berserk", "archer", "tank"]
-NUCLEUS_CRYSTALS = ["amber_crystal", "topaz_crystal", "amethyst_crystal", "jade_crystal", "sapphire_crystal"]
-ESSENCE_TYPES = ["WITHER", "DRAGON", "DIAMOND", "SPIDER", "UNDEAD", "GOLD", "ICE", "CRIMSON"]
-SLAYER_BOSS_KEYS = ["zombie", "spider", "wolf", "enderman", "blaze", "vampire"]
+CLASS_NAMES = ("healer", "mage", "berserk", "archer", "tank")
+NUCLEUS_CRYSTALS = ("amber_crystal", "topaz_crystal", "amethyst_crystal", "jade_crystal", "sapphire_crystal")
+ESSENCE_TYPES = ("WITHER", "DRAGON", "DIAMOND", "SPIDER", "UNDEAD", "GOLD", "ICE", "CRIMSON")
+SLAYER_BOSS_KEYS = ("zombie", "spider", "wolf", "enderman", "blaze", "vampire")
 
 BASE_M6_CLASS_XP = 105_000
 BASE_M7_CLASS_XP = 340_000
@@ -37,3 +38,12 @@ DERPY_XP_MULTIPLIER = 1.5
 
 MAX_MESSAGE_LENGTH = 480  # approx limit to avoid Twitch cutting messages
 CACHE_TTL = 300
+# IGN -> UUID only changes on a name change
+UUID_CACHE_TTL = 24 * 60 * 60
+UUID_CACHE_MAX_SIZE = 4096
+AUCTIONS_CACHE_TTL = 30
+# the mayor only changes every few days
+ELECTION_CACHE_TTL = 600
+# how long expired data is kept as a fallback for when the Hypixel API fails
+PROFILES_STALE_TTL = 60 * 60
+ELECTION_STALE_TTL = 24 * 60 * 60
@@ -1,3 +1,22 @@
+SECTION_SIGN = "§"
+
+
+def strip_color_codes(text: str) -> str:
+    """'§bSteve§r' -> 'Steve'; drops every Minecraft '§x' formatting pair."""
+    if SECTION_SIGN not in text:
+        return text
+    parts: list[str] = []
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i]
+        if c == SECTION_SIGN and i + 1 < n:
+            i += 2
+            continue
+        parts.append(c)
+        i += 1
+    return "".join(parts)
+
+
 def format_number(num: float) -> str:
     """1_500_000 -> '1.50M' (two decimals, uppercase suffix)."""
     if num >= 1_000_000_000:
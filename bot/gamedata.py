@@ -4,11 +4,11 @@ On startup the bot downloads fresh copies into DATA_DIR; loaders prefer the
 downloaded copy and fall back to the bundled files in bot/data/.
 """
 
-import json
 import logging
 from pathlib import Path
 
 import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +43,9 @@ async def sync_game_data(session: aiohttp.ClientSession, data_dir: Path) -> None
                         "game-data sync: GET %s returned %d, keeping local %s", url, response.status, name
                     )
                     continue
-                text = await response.text()
-            data = json.loads(text)
-        except (aiohttp.ClientError, json.JSONDecodeError) as e:
+                body = await response.read()
+            data = orjson.loads(body)
+        except (TimeoutError, aiohttp.ClientError, orjson.JSONDecodeError) as e:
             logger.warning("game-data sync: fetching %s failed (%s), keeping local copy", name, e)
             continue
 
@@ -56,11 +56,11 @@ async def sync_game_data(session: aiohttp.ClientSession, data_dir: Path) -> None
             continue
 
         current = data_file_path(name, data_dir)
-        if current.exists() and current.read_text(encoding="utf-8") == text:
+        if current.exists() and current.read_bytes() == body:
             logger.info("game-data sync: %s is up to date", name)
             continue
 
-        (data_dir / name).write_text(text, encoding="utf-8")
+        (data_dir / name).write_bytes(body)
         logger.info("game-data sync: updated %s from the NEU repo", name)
 
 
@@ -68,8 +68,7 @@ def load_area_names(data_dir: Path | None = None) -> dict[str, str]:
     """Island-code -> readable name mapping from islands.json."""
     path = data_file_path("islands.json", data_dir)
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f).get("area_names", {})
-    except (OSError, json.JSONDecodeError) as e:
+        return orjson.loads(path.read_bytes()).get("area_names", {})
+    except (OSError, orjson.JSONDecodeError) as e:
         logger.error("failed to load %s: %s", path, e)
         return {}
@@ -1,6 +1,9 @@
+import asyncio
 import logging
 import time
-from typing import Generic, TypeVar
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
 
 logger = logging.getLogger(__name__)
 
@@ -8,11 +11,18 @@ T = TypeVar("T")
 
 
 class TTLCache(Generic[T]):
-    """In-memory cache whose entries expire after a fixed time-to-live."""
+    """In-memory cache whose entries expire after a fixed time-to-live.
 
-    def __init__(self, ttl: int) -> None:
-        self._entries: dict[str, tuple[T, float]] = {}
+    With max_size set, the least recently used entry is evicted once the cache is full.
+    cleanup_expired() keeps expired entries around for get_stale() until they are
+    `stale_ttl` old (by default, as soon as they expire).
+    """
+
+    def __init__(self, ttl: int, max_size: int | None = None, stale_ttl: int | None = None) -> None:
+        self._entries: OrderedDict[str, tuple[T, float]] = OrderedDict()
         self.ttl = ttl
+        self.max_size = max_size
+        self.stale_ttl = ttl if stale_ttl is None else max(stale_ttl, ttl)
 
     def get(self, key: str) -> T | None:
         entry = self._entries.get(key)
@@ -24,17 +34,56 @@ class TTLCache(Generic[T]):
             logger.debug("cache expired for %r (age %ds)", key, int(age))
             return None
         logger.debug("cache hit for %r (age %ds)", key, int(age))
+        if self.max_size is not None:
+            self._entries.move_to_end(key)
         return value
 
+    def get_stale(self, key: str) -> T | None:
+        """The stored value regardless of age (until swept); a fallback for when a refresh fails."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
     def set(self, key: str, value: T) -> None:
         self._entries[key] = (value, time.time())
+        if self.max_size is not None:
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
 
     def cleanup_expired(self) -> int:
         now = time.time()
-        expired = [key for key, (_, ts) in self._entries.items() if now - ts >= self.ttl]
+        expired = [key for key, (_, ts) in self._entries.items() if now - ts >= self.stale_ttl]
         for key in expired:
             del self._entries[key]
         return len(expired)
 
     def size(self) -> int:
         return len(self._entries)
+
+
+class InFlight:
+    """Coalesces concurrent identical lookups: callers asking for a key that is already
+    being fetched await that fetch instead of starting their own."""
+
+    def __init__(self) -> None:
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+
+    def start(self, key: str, fetch: Callable[[], Awaitable[T]]) -> asyncio.Future[T]:
+        """The running fetch for `key`, started now if there is none; for fire-and-forget refreshes."""
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(fetch())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda done: self._finished(key, done))
+        return pending
+
+    def _finished(self, key: str, done: asyncio.Future[Any]) -> None:
+        self._pending.pop(key, None)
+        # a fire-and-forget refresh has no caller to see its error; retrieving it here also
+        # stops asyncio from reporting "Task exception was never retrieved"
+        if not done.cancelled() and (error := done.exception()) is not None:
+            logger.error("fetch for %r failed", key, exc_info=error)
+
+    async def run(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        # shield: one caller being cancelled must not cancel the fetch the others wait on
+        return await asyncio.shield(self.start(key, fetch))
@@ -1,23 +1,53 @@
+import asyncio
 import logging
+import time
 from typing import Any
 
 import aiohttp
+import orjson
 
 from bot.constants import (
+    AUCTIONS_CACHE_TTL,
     CACHE_TTL,
+    ELECTION_CACHE_TTL,
+    ELECTION_STALE_TTL,
     HYPIXEL_API_URL,
     HYPIXEL_AUCTION_URL,
     HYPIXEL_ELECTION_URL,
     HYPIXEL_GUILD_API_URL,
     HYPIXEL_MUSEUM_URL,
     HYPIXEL_STATUS_URL,
+    PROFILES_STALE_TTL,
 )
-from bot.hypixel.cache import TTLCache
+from bot.hypixel.cache import InFlight, TTLCache
+from bot.hypixel.ratelimit import RateLimitBudget
 
 logger = logging.getLogger(__name__)
 
 Json = dict[str, Any]
 
+REQUEST_TIMEOUT = 4
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# a chat reply should not wait on the API longer than this, whatever Retry-After says
+MAX_RETRY_AFTER = 5.0
+MAX_CONCURRENT_REQUESTS = 16
+# after a request exhausts its retries on 429/5xx, further requests
+# fail fast for this long (or the last Retry-After, up to MAX_BREAKER_COOLDOWN)
+BREAKER_COOLDOWN = 30.0
+MAX_BREAKER_COOLDOWN = 300.0
+
+
+def _retry_after_seconds(header: str | None, cap: float = MAX_RETRY_AFTER) -> float | None:
+    """Retry-After in seconds (capped), or None if missing or not a number."""
+    if header is None:
+        return None
+    try:
+        return min(max(float(header), 0.0), cap)
+    except ValueError:
+        return None
+
 
 class HypixelClient:
     """Typed wrapper around the Hypixel SkyBlock HTTP API."""
@@ -25,42 +55,130 @@ class HypixelClient:
     def __init__(self, api_key: str, session: aiohttp.ClientSession) -> None:
         self._api_key = api_key
         self._session = session
-        self.profiles_cache: TTLCache[list[Json]] = TTLCache(CACHE_TTL)
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._rate_limit = RateLimitBudget()
+        self._in_flight = InFlight()
+        self._breaker_open_until = 0.0
+        self.profiles_cache: TTLCache[list[Json]] = TTLCache(CACHE_TTL, stale_ttl=PROFILES_STALE_TTL)
         self._museum_cache: TTLCache[Json] = TTLCache(CACHE_TTL)
-        self._election_cache: TTLCache[Json] = TTLCache(CACHE_TTL)
+        self._mayor_cache: TTLCache[Json] = TTLCache(ELECTION_CACHE_TTL, stale_ttl=ELECTION_STALE_TTL)
+        self._auctions_cache: TTLCache[list[Json]] = TTLCache(AUCTIONS_CACHE_TTL)
+
+    async def _get_once(self, url: str, params: dict[str, str]) -> tuple[int, bytes, str | None]:
+        """One bounded GET: (status, body, Retry-After header)."""
+        headers = {"API-Key": self._api_key}
+        async with self._request_slots, asyncio.timeout(REQUEST_TIMEOUT):
+            async with self._session.get(url, params=params, headers=headers) as response:
+                self._rate_limit.update(response.headers)
+                return response.status, await response.read(), response.headers.get("Retry-After")
 
     async def _get_json(self, url: str, params: dict[str, str]) -> Json | None:
         """Returns the parsed response body on success=true, otherwise None.
 
+        Each attempt is bounded by REQUEST_TIMEOUT; timeouts, network errors and
+        429/5xx responses are retried with exponential backoff (429 honors Retry-After).
+        Once the rate-limit budget is spent, requests wait for the window to reset,
+        or fail right away if that is further off than MAX_RETRY_AFTER. A request that
+        runs out of retries on 429/5xx opens a breaker: until it closes, requests fail
+        right away too, so an outage is not hammered by every chat command (callers fall
+        back to cached data where they have it). Timeouts and network errors only fail
+        the request itself.
+
         The API key goes in the `API-Key` header, never a query param — otherwise it
         would leak into logs via aiohttp exception messages (which render the full URL).
         """
-        headers = {"API-Key": self._api_key}
-        try:
-            async with self._session.get(url, params=params, headers=headers) as response:
-                if response.status != 200:
-                    body = await response.text()
-                    logger.warning("GET %s failed: status %d, body %s", url, response.status, body[:300])
+        breaker_wait = self._breaker_open_until - time.monotonic()
+        if breaker_wait > 0:
+            logger.warning("GET %s skipped: Hypixel API backed off for another %.0fs", url, breaker_wait)
+            return None
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            backoff = RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            wait = self._rate_limit.wait_time()
+            if wait > MAX_RETRY_AFTER:
+                logger.warning("GET %s skipped: rate limit exhausted for another %.0fs", url, wait)
+                return None
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._rate_limit.spend()
+            try:
+                status, body, retry_after = await self._get_once(url, params)
+            except (TimeoutError, aiohttp.ClientError) as e:
+                error = str(e) or type(e).__name__
+                if attempt == MAX_ATTEMPTS:
+                    # no breaker: one slow profile fetch says little about the API as a whole
+                    logger.warning("GET %s failed: %s", url, error)
                     return None
-                data: Json = await response.json()
-        except aiohttp.ClientError as e:
-            logger.warning("GET %s failed: %s", url, e)
+                logger.warning(
+                    "GET %s failed (attempt %d/%d), retrying in %.1fs: %s",
+                    url,
+                    attempt,
+                    MAX_ATTEMPTS,
+                    backoff,
+                    error,
+                )
+                await asyncio.sleep(backoff)
+                continue
+
+            if status == 200:
+                break
+            if status not in RETRY_STATUSES or attempt == MAX_ATTEMPTS:
+                logger.warning(
+                    "GET %s failed: status %d, body %s", url, status, body[:300].decode(errors="replace")
+                )
+                if status in RETRY_STATUSES:
+                    self._open_breaker(retry_after if status == 429 else None)
+                return None
+            delay = _retry_after_seconds(retry_after) if status == 429 else None
+            delay = backoff if delay is None else delay
+            logger.warning(
+                "GET %s returned %d (attempt %d/%d), retrying in %.1fs",
+                url,
+                status,
+                attempt,
+                MAX_ATTEMPTS,
+                delay,
+            )
+            await asyncio.sleep(delay)
+        else:
+            return None
+
+        try:
+            # orjson straight from bytes: profile payloads are hundreds of KB
+            data: Json = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            logger.warning("GET %s returned invalid JSON: %s", url, e)
             return None
         if not data.get("success"):
             logger.warning("GET %s: success=false, cause: %s", url, data.get("cause", "unknown"))
             return None
         return data
 
+    def _open_breaker(self, retry_after: str | None) -> None:
+        cooldown = _retry_after_seconds(retry_after, MAX_BREAKER_COOLDOWN) or BREAKER_COOLDOWN
+        self._breaker_open_until = time.monotonic() + cooldown
+        logger.warning("Hypixel API unavailable, backing off for %.0fs", cooldown)
+
     async def get_profiles(self, uuid: str, use_cache: bool = True) -> list[Json] | None:
-        """All SkyBlock profiles for a player. None on API error, [] if the player has none."""
+        """All SkyBlock profiles for a player. None on API error, [] if the player has none.
+
+        Concurrent requests for the same player (chat spamming a command) share one fetch.
+        If the API fails, an expired cached copy (up to PROFILES_STALE_TTL old) is
+        returned instead of None.
+        """
         if use_cache:
             cached = self.profiles_cache.get(uuid)
             if cached is not None:
                 return cached
+        return await self._in_flight.run(f"profiles:{uuid}", lambda: self._fetch_profiles(uuid))
 
+    async def _fetch_profiles(self, uuid: str) -> list[Json] | None:
         data = await self._get_json(HYPIXEL_API_URL, {"uuid": uuid})
         if data is None:
-            return None
+            # an outdated answer beats an error while the API is down
+            stale = self.profiles_cache.get_stale(uuid)
+            if stale is not None:
+                logger.info("serving stale profiles for uuid %s after an API error", uuid)
+            return stale
         profiles = data.get("profiles")
         if profiles is None:
             logger.warning("profiles field missing/null for uuid %s", uuid)
@@ -90,25 +208,48 @@ class HypixelClient:
         """Online status ('session' key) for a player; None on error."""
         return await self._get_json(HYPIXEL_STATUS_URL, {"uuid": uuid})
 
-    async def get_election(self) -> Json | None:
-        cached = self._election_cache.get("election")
+    async def get_mayor(self) -> Json | None:
+        """The current mayor ({} if the election response has none); None on API error.
+
+        Only the 'mayor' object is kept, not the full election payload with every
+        candidate and vote count. Once the cached copy expires it is still returned
+        right away while a refresh runs in the background (the mayor changes only
+        every few days); on API error the last known copy is kept.
+        """
+        cached = self._mayor_cache.get("mayor")
         if cached is not None:
             return cached
+        stale = self._mayor_cache.get_stale("mayor")
+        if stale is not None:
+            self._in_flight.start("mayor", self._fetch_mayor)
+            return stale
+        return await self._in_flight.run("mayor", self._fetch_mayor)
+
+    async def _fetch_mayor(self) -> Json | None:
         data = await self._get_json(HYPIXEL_ELECTION_URL, {})
-        if data is not None:
-            self._election_cache.set("election", data)
-        return data
+        if data is None:
+            return self._mayor_cache.get_stale("mayor")
+        # {} is cached too: between elections it is the answer, not a miss
+        mayor = data.get("mayor") or {}
+        self._mayor_cache.set("mayor", mayor)
+        return mayor
 
     async def get_player_auctions(self, uuid: str) -> list[Json] | None:
+        cached = self._auctions_cache.get(uuid)
+        if cached is not None:
+            return cached
         data = await self._get_json(HYPIXEL_AUCTION_URL, {"player": uuid})
         if data is None:
             return None
         auctions = data.get("auctions")
-        return auctions if isinstance(auctions, list) else []
+        auctions = auctions if isinstance(auctions, list) else []
+        self._auctions_cache.set(uuid, auctions)
+        return auctions
 
     def cleanup_expired(self) -> int:
         return (
             self.profiles_cache.cleanup_expired()
             + self._museum_cache.cleanup_expired()
-            + self._election_cache.cleanup_expired()
+            + self._mayor_cache.cleanup_expired()
+            + self._auctions_cache.cleanup_expired()
         )
@@ -1,8 +1,12 @@
-import json
+import bisect
+import itertools
 import logging
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, TypedDict
 
+import orjson
+
 from bot.constants import AVERAGE_SKILLS_LIST
 from bot.gamedata import data_file_path
 
@@ -15,6 +19,10 @@ class LevelingData(TypedDict):
     catacombs_xp: list[int]
     hotm_brackets: list[int]
     slayer_xp: dict[str, list[int]]
+    # running totals of the tables above: *_cumulative[i] is the total XP for level i
+    xp_cumulative: list[int]
+    catacombs_cumulative: list[int]
+    hotm_cumulative: list[int]
 
 
 # the upstream NEU catacombs table ends at level 99; extend it so class/cata levels
@@ -31,17 +39,26 @@ def _extend_catacombs_table(catacombs_xp: list[int]) -> list[int]:
 
 
 def load_leveling_data(data_dir: Path | None = None) -> LevelingData:
-    with open(data_file_path("leveling.json", data_dir), encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(data_file_path("leveling.json", data_dir).read_bytes())
+    xp_table = data.get("leveling_xp", [])
+    catacombs_xp = _extend_catacombs_table(data.get("catacombs", []))
+    hotm_brackets = data.get("HOTM", [])
     return {
-        "xp_table": data.get("leveling_xp", []),
+        "xp_table": xp_table,
         "level_caps": data.get("leveling_caps", {}),
-        "catacombs_xp": _extend_catacombs_table(data.get("catacombs", [])),
-        "hotm_brackets": data.get("HOTM", []),
+        "catacombs_xp": catacombs_xp,
+        "hotm_brackets": hotm_brackets,
         "slayer_xp": data.get("slayer_xp", {}),
+        "xp_cumulative": _cumulative(xp_table),
+        "catacombs_cumulative": _cumulative(catacombs_xp),
+        "hotm_cumulative": _cumulative(hotm_brackets),
     }
 
 
+def _cumulative(xp_table: list[int]) -> list[int]:
+    return list(itertools.accumulate(xp_table, initial=0))
+
+
 def get_xp_for_target_level(leveling_data: LevelingData, target_level: int) -> float:
     """Total cumulative Catacombs XP required to complete a 1-based target level."""
     xp_table = leveling_data["catacombs_xp"]
@@ -49,37 +66,31 @@ def get_xp_for_target_level(leveling_data: LevelingData, target_level: int) -> f
         logger.warning("catacombs XP table not loaded")
         return float("inf")
 
-    target_level_index = target_level - 1
-    if target_level_index < 0:
+    if target_level <= 0:
         return 0.0
-    if target_level_index >= len(xp_table):
+    if target_level > len(xp_table):
         logger.warning(
             "target level %d exceeds catacombs XP table length (%d), using max", target_level, len(xp_table)
         )
-        return float(sum(xp_table))
-    return float(sum(xp_table[: target_level_index + 1]))
+        target_level = len(xp_table)
+    return float(leveling_data["catacombs_cumulative"][target_level])
 
 
-def _level_from_cumulative_table(xp: float, xp_table: list[int], max_level: int) -> float:
-    """Level (with fractional progress) from a per-level XP table, capped at max_level."""
-    total_xp_for_max = sum(xp_table[:max_level])
-    if xp >= total_xp_for_max:
+def _level_from_cumulative_table(
+    xp: float, xp_table: list[int], cumulative: Sequence[float], max_level: int
+) -> float:
+    """Level (with fractional progress) from a per-level XP table and its running totals,
+    capped at max_level."""
+    top = min(max_level, len(xp_table))
+    if xp >= cumulative[top]:
         return float(max_level)
 
-    total_xp_required = 0
-    level = 0
-    for i, required_xp in enumerate(xp_table):
-        if i >= max_level:
-            break
-        current_level_threshold = total_xp_required
-        total_xp_required += required_xp
-        if xp >= total_xp_required:
-            level += 1
-        else:
-            if required_xp > 0:
-                progress = (xp - current_level_threshold) / required_xp
-                return min(level + progress, float(max_level))
-            return min(float(level), float(max_level))
+    # the level being worked on: the last one whose total is already reached
+    level = max(bisect.bisect_right(cumulative, xp, 0, top + 1) - 1, 0)
+    required_xp = xp_table[level]
+    if required_xp > 0:
+        progress = (xp - cumulative[level]) / required_xp
+        return min(level + progress, float(max_level))
     return min(float(level), float(max_level))
 
 
@@ -99,7 +110,9 @@ def calculate_skill_level(
         jacobs_perks = member_data.get("jacobs_contest", {}).get("perks", {})
         effective_max_level = 50 + jacobs_perks.get("farming_level_cap", 0)
 
-    return _level_from_cumulative_table(xp, leveling_data["xp_table"], effective_max_level)
+    return _level_from_cumulative_table(
+        xp, leveling_data["xp_table"], leveling_data["xp_cumulative"], effective_max_level
+    )
 
 
 def calculate_hotm_level(leveling_data: LevelingData, xp: float) -> float:
@@ -107,7 +120,7 @@ def calculate_hotm_level(leveling_data: LevelingData, xp: float) -> float:
     if not brackets:
         logger.warning("HOTM XP brackets not loaded")
         return 0.0
-    return _level_from_cumulative_table(xp, brackets, len(brackets))
+    return _level_from_cumulative_table(xp, brackets, leveling_data["hotm_cumulative"], len(brackets))
 
 
 def calculate_dungeon_level(leveling_data: LevelingData, xp: float) -> float:
@@ -115,7 +128,7 @@ def calculate_dungeon_level(leveling_data: LevelingData, xp: float) -> float:
     if not xp_table:
         logger.warning("catacombs XP table not loaded")
         return 0.0
-    return _level_from_cumulative_table(xp, xp_table, 100)
+    return _level_from_cumulative_table(xp, xp_table, leveling_data["catacombs_cumulative"], 100)
 
 
 def calculate_class_level(leveling_data: LevelingData, xp: float) -> float:
@@ -126,21 +139,16 @@ def calculate_class_level(leveling_data: LevelingData, xp: float) -> float:
     # ponytail: cap 150 with a ~100-entry table means the cap is effectively the table
     # length; kept as-is for output parity with the old calculate_class_level
     max_class_level = 150
-    return _level_from_cumulative_table(xp, xp_table[:max_class_level], max_class_level)
+    return _level_from_cumulative_table(xp, xp_table, leveling_data["catacombs_cumulative"], max_class_level)
 
 
 def calculate_slayer_level(leveling_data: LevelingData, xp: float, boss_key: str) -> int:
-    thresholds = leveling_data["slayer_xp"].get(boss_key)
+    thresholds: Sequence[float] | None = leveling_data["slayer_xp"].get(boss_key)
     if not thresholds:
         logger.warning("slayer XP thresholds not loaded for boss %r", boss_key)
         return 0
-    level = 0
-    for i, threshold in enumerate(thresholds):
-        if xp >= threshold:
-            level = i + 1
-        else:
-            break
-    return level
+    # thresholds are cumulative and ascending: the level is how many are reached
+    return bisect.bisect_right(thresholds, xp)
 
 
 def calculate_average_skill_level(
@@ -2,9 +2,10 @@ import logging
 from typing import Any
 
 import aiohttp
+import orjson
 
-from bot.constants import CACHE_TTL, MOJANG_API_URL, MOJANG_API_URL_FALLBACK
-from bot.hypixel.cache import TTLCache
+from bot.constants import MOJANG_API_URL, MOJANG_API_URL_FALLBACK, UUID_CACHE_MAX_SIZE, UUID_CACHE_TTL
+from bot.hypixel.cache import InFlight, TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +15,17 @@ class MojangClient:
 
     def __init__(self, session: aiohttp.ClientSession) -> None:
         self._session = session
-        self.cache: TTLCache[str] = TTLCache(CACHE_TTL)
+        self.cache: TTLCache[str] = TTLCache(UUID_CACHE_TTL, max_size=UUID_CACHE_MAX_SIZE)
+        self._in_flight = InFlight()
 
     async def get_uuid(self, ign: str) -> str | None:
-        cached = self.cache.get(ign.lower())
+        key = ign.lower()
+        cached = self.cache.get(key)
         if cached:
             return cached
+        return await self._in_flight.run(key, lambda: self._fetch_uuid(ign))
 
+    async def _fetch_uuid(self, ign: str) -> str | None:
         urls = [
             MOJANG_API_URL.format(username=ign),
             MOJANG_API_URL_FALLBACK.format(username=ign),
@@ -30,7 +35,7 @@ class MojangClient:
             try:
                 async with self._session.get(url) as response:
                     if response.status == 200:
-                        data: dict[str, Any] = await response.json()
+                        data: dict[str, Any] = await response.json(loads=orjson.loads)
                         uuid = data.get("id")
                         if uuid:
                             self.cache.set(ign.lower(), uuid)
@@ -43,6 +48,6 @@ class MojangClient:
                         logger.warning(
                             "%s request for %r failed with status %d", api_name, ign, response.status
                         )
-            except aiohttp.ClientError as e:
+            except (TimeoutError, aiohttp.ClientError) as e:
                 logger.warning("%s request for %r failed: %s", api_name, ign, e)
         return None
@@ -4,7 +4,9 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from bot.constants import CACHE_TTL
 from bot.errors import UserError
+from bot.hypixel.cache import TTLCache
 from bot.hypixel.client import HypixelClient
 from bot.hypixel.mojang import MojangClient
 
@@ -17,7 +19,22 @@ logger = logging.getLogger(__name__)
 Json = dict[str, Any]
 
 
-@dataclass(frozen=True)
+def dig(data: Any, *path: str, default: Any = None) -> Any:
+    """data[path[0]][path[1]]..., or `default` at the first key that is missing or null.
+
+    Unlike chained .get(key, {}) calls this allocates nothing on a miss and does not
+    break on a null or non-dict value halfway down the path.
+    """
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+@dataclass(frozen=True, slots=True)
 class PlayerProfile:
     ign: str
     uuid: str
@@ -33,20 +50,44 @@ class PlayerProfile:
         return self.profile.get("profile_id")
 
 
-def select_profile(profiles: list[Json], player_uuid: str, requested_name: str | None) -> Json | None:
-    """Picks the requested profile by cute_name, else the selected/most recent one."""
+def build_name_index(profiles: list[Json]) -> dict[str, Json]:
+    """Maps each lowercased cute_name to its profile (the first one, if a name repeats)."""
+    index: dict[str, Json] = {}
+    for profile in profiles:
+        cute_name = profile.get("cute_name")
+        if cute_name:
+            index.setdefault(cute_name.lower(), profile)
+    return index
+
+
+def select_profile(
+    profiles: list[Json],
+    player_uuid: str,
+    requested_name: str | None,
+    name_index: dict[str, Json] | None = None,
+) -> Json | None:
+    """Picks the requested profile by cute_name, else the selected/most recent one.
+
+    name_index (from build_name_index) saves rebuilding the name lookup for a
+    profile list that is selected from repeatedly.
+    """
     if requested_name:
-        requested_lower = requested_name.lower()
-        for profile in profiles:
-            cute_name = profile.get("cute_name")
-            if cute_name and cute_name.lower() == requested_lower:
-                if player_uuid in profile.get("members", {}):
-                    return profile
-                logger.warning(
-                    "profile %r matches request but player %s is not a member", cute_name, player_uuid
-                )
+        if name_index is None:
+            name_index = build_name_index(profiles)
+        profile = name_index.get(requested_name.lower())
+        if profile is not None:
+            if player_uuid in profile.get("members", {}):
+                return profile
+            logger.warning(
+                "profile %r matches request but player %s is not a member", profile["cute_name"], player_uuid
+            )
         logger.info("requested profile %r not found, falling back to latest", requested_name)
 
+    if len(profiles) == 1:
+        # the common case: nothing to choose between
+        only = profiles[0]
+        return only if player_uuid in only.get("members", {}) else None
+
     for profile in profiles:
         if profile.get("selected", False) and player_uuid in profile.get("members", {}):
             return profile
@@ -70,15 +111,26 @@ class ProfileService:
         self._mojang = mojang
         self._hypixel = hypixel
         self._links = links
+        # per uuid: the cached profile list and its name index, rebuilt when the list changes
+        self._name_indexes: TTLCache[tuple[list[Json], dict[str, Json]]] = TTLCache(CACHE_TTL, max_size=1024)
+
+    def _name_index(self, uuid: str, profiles: list[Json]) -> dict[str, Json]:
+        entry = self._name_indexes.get(uuid)
+        if entry is not None and entry[0] is profiles:
+            return entry[1]
+        index = build_name_index(profiles)
+        self._name_indexes.set(uuid, (profiles, index))
+        return index
 
     def resolve_ign(self, ign_arg: str | None, author_name: str) -> str:
-        """The IGN to look up: explicit argument, else the author's linked IGN, else their name."""
-        if not ign_arg or not ign_arg.strip() or ign_arg == author_name:
-            linked = self._links.get(author_name)
-            if linked:
-                return linked
-            return author_name
-        return ign_arg.strip().lstrip("@")
+        """The IGN to look up: explicit argument, else the author's linked IGN, else their name.
+
+        A leading '@' (chat mention) is dropped; naming yourself counts as no argument.
+        """
+        ign = ign_arg.strip().lstrip("@") if ign_arg else ""
+        if not ign or ign.lower() == author_name.lower():
+            return self._links.get(author_name) or author_name
+        return ign
 
     async def fetch(
         self,
@@ -102,7 +154,8 @@ class ProfileService:
         if not profiles:
             raise UserError(f"'{target_ign}' seems to have no SkyBlock profiles yet.")
 
-        profile = select_profile(profiles, uuid, profile_arg)
+        name_index = self._name_index(uuid, profiles) if profile_arg else None
+        profile = select_profile(profiles, uuid, profile_arg, name_index)
         if not profile:
             profile_msg = f"the requested profile '{profile_arg}' or" if profile_arg else "an active"
             raise UserError(
@@ -110,5 +163,5 @@ class ProfileService:
                 f"Player must be a member of at least one profile."
             )
 
-        member = profile.get("members", {}).get(uuid, {})
+        member = profile.get("members", {}).get(uuid) or {}
         return PlayerProfile(ign=target_ign, uuid=uuid, profile=profile, member=member)
@@ -0,0 +1,43 @@
+import logging
+import time
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBudget:
+    """Tracks the request budget from the RateLimit-Remaining / RateLimit-Reset headers.
+
+    Hypixel answers every keyed request with how many calls are left in the current
+    window and how many seconds until it resets; requests are held back once the
+    budget is spent instead of being sent just to come back as 429.
+    """
+
+    def __init__(self) -> None:
+        self._remaining: int | None = None
+        self._reset_at = 0.0
+
+    def wait_time(self) -> float:
+        """Seconds until a request may be sent (0 if the budget is not exhausted)."""
+        if self._remaining is None or self._remaining > 0:
+            return 0.0
+        return max(self._reset_at - time.monotonic(), 0.0)
+
+    def spend(self) -> None:
+        """Counts a request that is about to be sent against the known budget."""
+        if self._remaining is not None:
+            if time.monotonic() >= self._reset_at:
+                self._remaining = None  # window rolled over, wait for fresh headers
+            else:
+                self._remaining -= 1
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        try:
+            remaining = int(headers["RateLimit-Remaining"])
+            reset_in = int(headers["RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        self._remaining = remaining
+        self._reset_at = time.monotonic() + reset_in
+        if remaining <= 0:
+            logger.warning("Hypixel rate limit exhausted, resets in %ds", reset_in)
@@ -1,11 +1,28 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 
 
 def setup_logging(level: str) -> None:
-    logging.basicConfig(
-        level=level.upper(),
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    """Logs to stderr from a background thread.
+
+    Handlers on the event loop only put records on a queue, so a slow terminal or
+    log pipe never stalls command handling.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
     )
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    # flush whatever is still queued on shutdown
+    atexit.register(listener.stop)
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # message only (plus traceback): the stream handler applies the real format
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level.upper(), handlers=[queue_handler])
     # twitchio logs every raw IRC line on DEBUG; keep it at INFO
     logging.getLogger("twitchio").setLevel(logging.INFO)
@@ -25,6 +25,14 @@ class Services:
     area_names: dict[str, str]
 
 
+def create_session() -> aiohttp.ClientSession:
+    """The single HTTP session every client shares, so connections and DNS lookups are reused."""
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75)
+    # pyrefly reads ClientTimeout (an attrs class) as taking no arguments
+    timeout = aiohttp.ClientTimeout(total=10)  # pyrefly: ignore[unexpected-keyword]
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
 def build_services(settings: Settings, session: aiohttp.ClientSession) -> Services:
     mojang = MojangClient(session)
     hypixel = HypixelClient(settings.hypixel_api_key, session)
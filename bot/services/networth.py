@@ -3,11 +3,15 @@ import logging
 from typing import Any
 
 import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
 Json = dict[str, Any]
 
+# pricing a large profile takes the Node service longer than the session's default timeout
+CALCULATE_TIMEOUT = aiohttp.ClientTimeout(total=30)  # pyrefly: ignore[unexpected-keyword]
+
 
 class NetworthClient:
     """Talks to the local Node.js skyhelper-networth service."""
@@ -25,7 +29,7 @@ class NetworthClient:
                     if response.status == 200:
                         logger.info("networth service is ready")
                         return True
-            except aiohttp.ClientError:
+            except (TimeoutError, aiohttp.ClientError):
                 pass
             await asyncio.sleep(delay * (attempt + 1))
         logger.warning("networth service not reachable after %d attempts", attempts)
@@ -41,12 +45,18 @@ class NetworthClient:
             "bankBalance": bank_balance,
         }
         try:
-            async with self._session.post(self._calculate_url, json=payload) as response:
+            # the payload carries the whole profile; orjson encodes it several times faster
+            async with self._session.post(
+                self._calculate_url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=CALCULATE_TIMEOUT,
+            ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=orjson.loads)
                 body = await response.text()
                 logger.error("networth service returned status %d: %s", response.status, body[:200])
                 return None
-        except aiohttp.ClientError as e:
-            logger.error("failed to reach networth service: %s", e)
+        except (TimeoutError, aiohttp.ClientError) as e:
+            logger.error("failed to reach networth service: %s", str(e) or type(e).__name__)
             return None
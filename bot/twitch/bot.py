@@ -2,21 +2,25 @@
 # callback annotations in this module's globals.
 import asyncio
 import logging
+import time
 
-import aiohttp
 from twitchio.ext import commands
 
 from bot.commands import REGISTRY, CommandContext, CommandSpec
 from bot.config import Settings
+from bot.constants import MAX_MESSAGE_LENGTH
 from bot.errors import UserError
 from bot.gamedata import sync_game_data
-from bot.services import Services, build_services
-from bot.twitch.channels import ChannelManager
+from bot.services import Services, build_services, create_session
+from bot.twitch.channels import ChannelManager, connected_channel_names
+from bot.twitch.chat import CHAT_MESSAGES_PER_WINDOW, CHAT_WINDOW_SECONDS, ChatSender, TokenBucket
 from bot.twitch.streams import StreamScanner
 
 logger = logging.getLogger(__name__)
 
 CACHE_CLEANUP_INTERVAL = 3600
+# a command failing over and over logs its full traceback at most this often
+ERROR_TRACEBACK_INTERVAL = 60
 
 
 class SkyBot(commands.Bot):
@@ -27,6 +31,11 @@ class SkyBot(commands.Bot):
         self.services: Services | None = None
         self.channel_manager: ChannelManager | None = None
         self._ready_once = False
+        self._last_traceback: dict[str, float] = {}
+        # one rate limit shared by every channel: Twitch counts messages per account
+        self.chat = ChatSender(
+            self, TokenBucket(CHAT_MESSAGES_PER_WINDOW, CHAT_WINDOW_SECONDS), MAX_MESSAGE_LENGTH
+        )
         super().__init__(
             token=settings.token,
             prefix=settings.prefix,
@@ -54,14 +63,21 @@ class SkyBot(commands.Bot):
                 await spec.handler(cc)
             except UserError as e:
                 await cc.reply(str(e))
-            except Exception:
-                logger.exception(
-                    "command %r failed (channel #%s, args %r)", spec.name, ctx.channel.name, args
-                )
+            except Exception as e:
+                self._log_command_error(spec.name, ctx.channel.name, args, e)
                 await cc.reply("An unexpected error occurred.")
 
         return callback
 
+    def _log_command_error(self, name: str, channel: str, args: str | None, error: Exception) -> None:
+        now = time.monotonic()
+        last = self._last_traceback.get(name)
+        if last is None or now - last >= ERROR_TRACEBACK_INTERVAL:
+            self._last_traceback[name] = now
+            logger.error("command %r failed (channel #%s, args %r)", name, channel, args, exc_info=error)
+        else:
+            logger.error("command %r failed again (channel #%s, args %r): %r", name, channel, args, error)
+
     # --- events ---
 
     async def event_ready(self) -> None:
@@ -70,13 +86,12 @@ class SkyBot(commands.Bot):
             return
         self._ready_once = True
 
-        session = aiohttp.ClientSession()
+        session = create_session()
         await sync_game_data(session, self.settings.data_dir)
         self.services = build_services(self.settings, session)
         logger.info("logged in as %s (%s)", self.nick, self.user_id)
 
-        connected = [ch.name for ch in self.connected_channels if ch is not None]
-        logger.info("joined initial channels: %s", connected)
+        logger.info("joined initial channels: %s", sorted(connected_channel_names(self)))
 
         asyncio.create_task(self._periodic_cache_cleanup())
         asyncio.create_task(self.services.networth.wait_until_ready())
@@ -89,8 +104,8 @@ class SkyBot(commands.Bot):
                 self.settings.twitch_client_id, self.settings.twitch_client_secret, session
             )
             self.channel_manager = ChannelManager(self, scanner, self.settings.initial_channels)
-            await self.channel_manager.initial_scan()
-            asyncio.create_task(self.channel_manager.monitor_loop())
+            # in the background: commands in the configured channels work while the scan runs
+            asyncio.create_task(self.channel_manager.run())
 
         logger.info("bot is ready")
 
@@ -99,8 +114,10 @@ class SkyBot(commands.Bot):
             return
         if not getattr(message.channel, "name", None) or not getattr(message.author, "name", None):
             return
-        connected = {ch.name for ch in self.connected_channels if ch is not None}
-        if message.channel.name not in connected:
+        # a dict lookup in twitchio's channel cache (which connected_channels is built
+        # from), instead of rebuilding the whole set of channel names per message.
+        # twitchio's @id_cache decorator hides get_channel's real signature from pyrefly
+        if self.get_channel(message.channel.name) is None:  # pyrefly: ignore[missing-argument]
             return
         await self.handle_commands(message)
 
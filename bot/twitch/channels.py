@@ -13,6 +13,13 @@ MONITOR_INTERVAL = 120
 MONITOR_ERROR_RETRY = 300
 OFFLINE_TIMEOUT_MINUTES = 15
 MAX_JOIN_ATTEMPTS = 5
+# how long a scan waits for Twitch to confirm its joins
+JOIN_WAIT_TIMEOUT = 5
+
+
+def connected_channel_names(bot: commands.Bot) -> set[str]:
+    """Names of the channels the bot is currently in."""
+    return {ch.name for ch in bot.connected_channels if ch is not None}
 
 
 class ChannelManager:
@@ -28,15 +35,24 @@ class ChannelManager:
         self._join_attempts: dict[str, int] = {}
         self.blacklisted: set[str] = set()
         self._pending_leave: dict[str, float] = {}
+        # resolved by on_joined / on_join_failure: True once joined, False if the join failed
+        self._join_waiters: dict[str, asyncio.Future[bool]] = {}
 
     def _connected_names(self) -> set[str]:
-        return {ch.name for ch in self._bot.connected_channels if ch is not None}
+        return connected_channel_names(self._bot)
+
+    def _resolve_join(self, channel_lower: str, joined: bool) -> None:
+        waiter = self._join_waiters.pop(channel_lower, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(joined)
 
     def on_joined(self, channel_name: str) -> None:
         self._join_attempts.pop(channel_name.lower(), None)
+        self._resolve_join(channel_name.lower(), True)
 
     def on_join_failure(self, channel_name: str) -> None:
         channel_lower = channel_name.lower()
+        self._resolve_join(channel_lower, False)
         attempts = self._join_attempts.get(channel_lower, 0) + 1
         self._join_attempts[channel_lower] = attempts
         logger.warning("failed to join #%s (attempt %d/%d)", channel_name, attempts, MAX_JOIN_ATTEMPTS)
@@ -67,6 +83,26 @@ class ChannelManager:
                 except Exception as individual_error:
                     logger.error("individual join failed for #%s: %s", channel, individual_error)
 
+    async def _join_and_wait(self, channels: list[str], timeout: float) -> None:
+        """safe_join, then wait until Twitch confirmed (or refused) each join, at most `timeout`."""
+        loop = asyncio.get_running_loop()
+        # registered before joining so a fast confirmation can't slip past
+        waiters = [
+            self._join_waiters.setdefault(ch.lower(), loop.create_future())
+            for ch in channels
+            if ch.lower() not in self.blacklisted
+        ]
+        await self.safe_join(channels)
+        if not waiters:
+            return
+        _, pending = await asyncio.wait(waiters, timeout=timeout)
+        if pending:
+            logger.info("%d channel joins still unconfirmed after %.0fs", len(pending), timeout)
+        # drop unconfirmed waiters so a later join of the same channel starts fresh
+        for name, waiter in list(self._join_waiters.items()):
+            if waiter in pending:
+                del self._join_waiters[name]
+
     async def initial_scan(self) -> None:
         live_streamers = await self._scanner.fetch_live_skyblock_streamers()
         if live_streamers is None:
@@ -76,10 +112,17 @@ class ChannelManager:
         to_join = [name for name in live_streamers if name.lower() not in connected]
         if to_join:
             logger.info("joining %d live SkyBlock channels: %s", len(to_join), to_join)
-            await self.safe_join(to_join)
-            await asyncio.sleep(5)
+            await self._join_and_wait(to_join, JOIN_WAIT_TIMEOUT)
         logger.info("connected channels after initial scan: %s", sorted(self._connected_names()))
 
+    async def run(self) -> None:
+        """Joins the channels that are already live, then keeps monitoring."""
+        try:
+            await self.initial_scan()
+        except Exception:
+            logger.exception("initial stream scan failed, monitoring will still run")
+        await self.monitor_loop()
+
     async def monitor_loop(self) -> None:
         logger.info("stream monitor started (interval %ds)", MONITOR_INTERVAL)
         while True:
@@ -128,16 +171,19 @@ class ChannelManager:
                 await self._bot.part_channels(to_leave)
             except Exception as e:
                 logger.error("error leaving channels %s: %s", to_leave, e)
+            else:
+                connected_names.difference_update(to_leave)
 
         if to_join:
             logger.info("joining %d new live channels: %s", len(to_join), to_join)
-            await self.safe_join(to_join)
-            await asyncio.sleep(3)
+            await self._join_and_wait(to_join, JOIN_WAIT_TIMEOUT)
+            # only Twitch knows which joins went through: take a fresh snapshot
+            connected_names = self._connected_names()
 
         if to_join or to_leave or self._pending_leave:
             logger.info(
                 "monitor status: %d connected, %d pending leave, %d blacklisted",
-                len(self._connected_names()),
+                len(connected_names),
                 len(self._pending_leave),
                 len(self.blacklisted),
             )
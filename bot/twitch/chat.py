@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, cast
+
+from twitchio.ext import commands
+
+logger = logging.getLogger(__name__)
+
+# Twitch drops messages from a (non-moderator) account past 20 per 30 seconds
+CHAT_MESSAGES_PER_WINDOW = 20
+CHAT_WINDOW_SECONDS = 30.0
+# per channel; past this backlog new replies are dropped, they would arrive minutes late
+MAX_QUEUED_MESSAGES = 50
+
+
+class TokenBucket:
+    """Allows bursts of up to `capacity` calls, refilled evenly over `period` seconds.
+
+    acquire() only sleeps once the bucket is empty, so sends below the limit go out
+    without any delay.
+    """
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self.capacity = capacity
+        self._refill_rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._refill_rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # the lock keeps waiters in FIFO order instead of all waking for the same token
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= 1
+
+
+@dataclass
+class _Outgoing:
+    text: str
+    fallback: Callable[[str], Awaitable[Any]]
+    sent: asyncio.Future[None]
+
+
+def _fail_unsent(items: list[_Outgoing], channel_name: str) -> None:
+    for item in items:
+        if not item.sent.done():
+            item.sent.set_exception(RuntimeError(f"chat sender for #{channel_name} stopped"))
+
+
+class ChatSender:
+    """Sends chat messages through one queue per channel, drained by a background task.
+
+    Messages that pile up while the drain waits on the rate limit are merged into a
+    single chat line when they fit, so a burst of replies costs fewer sends.
+    """
+
+    def __init__(self, bot: commands.Bot, limit: TokenBucket, max_length: int) -> None:
+        self._bot = bot
+        self._limit = limit
+        self._max_length = max_length
+        self._queues: dict[str, asyncio.Queue[_Outgoing]] = {}
+        self._drains: dict[str, asyncio.Task[None]] = {}
+
+    async def send(self, channel_name: str, text: str, fallback: Callable[[str], Awaitable[Any]]) -> None:
+        """Queues `text` and waits until it is sent; `fallback` is used if the channel is gone.
+
+        If the channel already has MAX_QUEUED_MESSAGES waiting, the message is dropped.
+        """
+        queue = self._queues.get(channel_name)
+        drain = self._drains.get(channel_name)
+        if queue is None or drain is None or drain.done():
+            queue = self._queues[channel_name] = asyncio.Queue(MAX_QUEUED_MESSAGES)
+            drain = self._drains[channel_name] = asyncio.create_task(self._drain(channel_name, queue))
+            drain.add_done_callback(lambda _: self._forget(channel_name, queue))
+        if queue.full():
+            logger.warning("chat queue for #%s is full, dropping: %s", channel_name, text)
+            return
+        sent: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.put_nowait(_Outgoing(text, fallback, sent))
+        await sent
+
+    async def _drain(self, channel_name: str, queue: asyncio.Queue[_Outgoing]) -> None:
+        """Sends the queued messages and exits once the queue is empty.
+
+        The next send() to the channel starts a new drain, so channels the bot has left
+        keep no queue or task around.
+        """
+        carry: _Outgoing | None = None
+        batch: list[_Outgoing] = []
+        try:
+            while carry or not queue.empty():
+                first = carry or queue.get_nowait()
+                carry = None
+                batch = [first]
+                length = len(first.text)
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    if length + 1 + len(item.text) > self._max_length:
+                        carry = item
+                        break
+                    batch.append(item)
+                    length += 1 + len(item.text)
+
+                try:
+                    await self._limit.acquire()
+                    await self._deliver(channel_name, " ".join(item.text for item in batch), first.fallback)
+                except Exception as e:
+                    for item in batch:
+                        if not item.sent.done():
+                            item.sent.set_exception(e)
+                else:
+                    for item in batch:
+                        if not item.sent.done():
+                            item.sent.set_result(None)
+        finally:
+            # only reached with messages in hand if the drain was cancelled or died
+            _fail_unsent([*batch, *([carry] if carry else [])], channel_name)
+
+    def _forget(self, channel_name: str, queue: asyncio.Queue[_Outgoing]) -> None:
+        """Unregisters a finished drain; anything still queued (a drain cancelled before it
+        ran) fails instead of waiting forever."""
+        if self._queues.get(channel_name) is queue:
+            del self._queues[channel_name]
+            del self._drains[channel_name]
+        _fail_unsent([queue.get_nowait() for _ in range(queue.qsize())], channel_name)
+
+    async def _deliver(self, channel_name: str, text: str, fallback: Callable[[str], Awaitable[Any]]) -> None:
+        # re-fetch the channel object instead of ctx.send; ctx can go stale on busy channels.
+        # Any-cast: twitchio's @id_cache decorator hides get_channel's real signature from pyrefly
+        channel = cast("Any", self._bot).get_channel(channel_name)
+        if channel:
+            await channel.send(text)
+        else:
+            logger.warning("could not re-fetch channel %s, falling back to ctx.send", channel_name)
+            await fallback(text)
@@ -1,16 +1,26 @@
 import asyncio
 import logging
+import re
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
 import aiohttp
+import orjson
+
+from bot.hypixel.cache import InFlight, TTLCache
 
 logger = logging.getLogger(__name__)
 
 TWITCH_TOKEN_URL = "https://id.twitch.tv/oauth2/token"
 TWITCH_STREAMS_URL = "https://api.twitch.tv/helix/streams"
 MINECRAFT_GAME_ID = "27471"
-SKYBLOCK_TITLE_TERMS = ("skyblock", "sky block", "sky-block")
+# "skyblock", "sky block" or "sky-block", matched against the lowercased title
+SKYBLOCK_TITLE_RE = re.compile(r"sky[ -]?block")
+# the startup scan and the first monitor tick run back to back; one Helix pass serves both
+STREAMERS_CACHE_TTL = 60
+# app access tokens live for weeks; renew this many seconds before Twitch's expires_in
+TOKEN_EXPIRY_MARGIN = 300
 
 T = TypeVar("T")
 
@@ -43,9 +53,19 @@ class StreamScanner:
         self._client_id = client_id
         self._client_secret = client_secret
         self._session = session
+        self._streamers_cache: TTLCache[list[str]] = TTLCache(STREAMERS_CACHE_TTL)
+        self._in_flight = InFlight()
+        self._access_token: str | None = None
+        self._token_expires_at = 0.0
 
-    @retry_on_network_error(retries=3, delay=5)
     async def _get_access_token(self) -> str | None:
+        """The app access token, reused until shortly before it expires."""
+        if self._access_token is not None and time.monotonic() < self._token_expires_at:
+            return self._access_token
+        return await self._request_access_token()
+
+    @retry_on_network_error(retries=3, delay=5)
+    async def _request_access_token(self) -> str | None:
         # credentials go in the form body, never the query string — a query param would
         # leak the client secret into logs via aiohttp exception messages (full URL)
         payload = {
@@ -59,31 +79,47 @@ class StreamScanner:
                     "failed to get Twitch token: status %d, %s", response.status, await response.text()
                 )
                 return None
-            data = await response.json()
+            data = await response.json(loads=orjson.loads)
             token = data.get("access_token")
             if not token:
                 logger.error("Twitch token response contained no access_token")
+                return None
+            self._access_token = token
+            self._token_expires_at = time.monotonic() + data.get("expires_in", 0) - TOKEN_EXPIRY_MARGIN
             return token
 
-    @retry_on_network_error(retries=3, delay=5)
     async def fetch_live_skyblock_streamers(self) -> list[str] | None:
-        """Login names of live Minecraft streams with 'hypixel' + a skyblock term in the title."""
+        """Login names of live Minecraft streams with 'hypixel' + a skyblock term in the title.
+
+        A successful scan is reused for STREAMERS_CACHE_TTL seconds, and callers that
+        arrive while a scan is running share it.
+        """
+        cached = self._streamers_cache.get("streamers")
+        if cached is not None:
+            return cached
+        return await self._in_flight.run("streamers", self._refresh_streamers)
+
+    async def _refresh_streamers(self) -> list[str] | None:
+        streamers = await self._scan_live_skyblock_streamers()
+        if streamers is not None:
+            self._streamers_cache.set("streamers", streamers)
+        return streamers
+
+    @retry_on_network_error(retries=3, delay=5)
+    async def _scan_live_skyblock_streamers(self) -> list[str] | None:
         access_token = await self._get_access_token()
         if not access_token:
             return None
 
         headers = {"Client-ID": self._client_id, "Authorization": f"Bearer {access_token}"}
         streamers: set[str] = set()
-        cursor: str | None = None
+        params = {"game_id": MINECRAFT_GAME_ID, "first": "100"}
 
         while True:
-            params: dict[str, str] = {"game_id": MINECRAFT_GAME_ID, "first": "100"}
-            if cursor:
-                params["after"] = cursor
-
             async with self._session.get(TWITCH_STREAMS_URL, headers=headers, params=params) as response:
                 if response.status == 401:
                     logger.warning("Helix returned 401, refreshing token")
+                    self._access_token = None
                     access_token = await self._get_access_token()
                     if not access_token:
                         return None
@@ -94,11 +130,11 @@ class StreamScanner:
                         "failed to fetch streams page: status %d, %s", response.status, await response.text()
                     )
                     break
-                data = await response.json()
+                data = await response.json(loads=orjson.loads)
 
             for stream in data.get("data", []):
                 title = stream.get("title", "").lower()
-                if "hypixel" in title and any(term in title for term in SKYBLOCK_TITLE_TERMS):
+                if "hypixel" in title and SKYBLOCK_TITLE_RE.search(title):
                     login_name = stream.get("user_login")
                     if login_name:
                         streamers.add(login_name)
@@ -106,5 +142,6 @@ class StreamScanner:
             cursor = data.get("pagination", {}).get("cursor")
             if not cursor:
                 break
+            params["after"] = cursor
 
         return list(streamers)
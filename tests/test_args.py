@@ -25,6 +25,12 @@ def test_too_many_args_raises_with_usage() -> None:
         cc.parse_ign_profile()
 
 
+def test_first_arg_ignores_the_rest() -> None:
+    assert FakeCommandContext(raw_args=None).first_arg is None
+    assert FakeCommandContext(raw_args="Steve").first_arg == "Steve"
+    assert FakeCommandContext(raw_args="Steve Apple extra").first_arg == "Steve"
+
+
 def test_usage_string_uses_prefix_and_name() -> None:
     cc = FakeCommandContext()
     assert cc.usage == "#test <ign> [profile]"
@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 
 from bot.hypixel import cache as cache_module
-from bot.hypixel.cache import TTLCache
+from bot.hypixel.cache import InFlight, TTLCache
 
 
 @pytest.fixture
@@ -39,3 +41,57 @@ def test_cleanup_expired(clock: dict[str, float]) -> None:
     assert cache.cleanup_expired() == 1
     assert cache.size() == 1
     assert cache.get("new") == "2"
+
+
+def test_get_stale_ignores_ttl(clock: dict[str, float]) -> None:
+    cache: TTLCache[str] = TTLCache(ttl=300)
+    cache.set("key", "value")
+    clock["now"] += 1000
+    assert cache.get("key") is None
+    assert cache.get_stale("key") == "value"
+    assert cache.get_stale("missing") is None
+
+
+def test_cleanup_keeps_stale_entries_until_stale_ttl(clock: dict[str, float]) -> None:
+    cache: TTLCache[str] = TTLCache(ttl=300, stale_ttl=3600)
+    cache.set("key", "value")
+    clock["now"] += 1000
+    assert cache.cleanup_expired() == 0
+    assert cache.get_stale("key") == "value"
+    clock["now"] += 2600
+    assert cache.cleanup_expired() == 1
+    assert cache.get_stale("key") is None
+
+
+async def test_in_flight_coalesces_concurrent_calls() -> None:
+    in_flight = InFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    waiters = [asyncio.create_task(in_flight.run("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiters) == ["value"] * 3
+    assert calls == 1
+
+    # finished fetches are forgotten, the next call fetches again
+    assert await in_flight.run("key", fetch) == "value"
+    assert calls == 2
+
+
+def test_max_size_evicts_least_recently_used() -> None:
+    cache: TTLCache[str] = TTLCache(ttl=300, max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "b" is now the least recently used
+    cache.set("c", "3")
+    assert cache.size() == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
@@ -0,0 +1,68 @@
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from twitchio.ext import commands
+
+from bot.twitch import channels as channels_module
+from bot.twitch.channels import ChannelManager
+from bot.twitch.streams import StreamScanner
+
+
+class FakeBot:
+    """Confirms (or refuses) each join on the next loop iteration, like Twitch's JOIN echo."""
+
+    def __init__(self, refuse: frozenset[str] = frozenset()) -> None:
+        self.manager: ChannelManager | None = None
+        self.refuse = refuse
+        self.connected_channels: list[SimpleNamespace] = []
+
+    async def join_channels(self, names: list[str]) -> None:
+        loop = asyncio.get_running_loop()
+        for name in names:
+            assert self.manager is not None
+            if name in self.refuse:
+                loop.call_soon(self.manager.on_join_failure, name)
+            else:
+                self.connected_channels.append(SimpleNamespace(name=name))
+                loop.call_soon(self.manager.on_joined, name)
+
+
+def make_manager(live: list[str], bot: FakeBot) -> ChannelManager:
+    async def fetch_live() -> list[str]:
+        return live
+
+    scanner = SimpleNamespace(fetch_live_skyblock_streamers=fetch_live)
+    manager = ChannelManager(cast(commands.Bot, bot), cast(StreamScanner, scanner), ())
+    bot.manager = manager
+    return manager
+
+
+async def test_initial_scan_returns_once_joins_are_confirmed() -> None:
+    bot = FakeBot(refuse=frozenset({"b"}))
+    manager = make_manager(["a", "b"], bot)
+    await asyncio.wait_for(manager.initial_scan(), timeout=1)
+    assert [ch.name for ch in bot.connected_channels] == ["a"]
+    assert manager._join_waiters == {}
+
+
+async def test_initial_scan_gives_up_after_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(channels_module, "JOIN_WAIT_TIMEOUT", 0.01)
+    bot = FakeBot()
+    manager = make_manager(["a"], bot)
+
+    async def silent_join(names: list[str]) -> None:
+        pass
+
+    monkeypatch.setattr(bot, "join_channels", silent_join)
+    await asyncio.wait_for(manager.initial_scan(), timeout=1)
+    assert manager._join_waiters == {}
+
+
+async def test_monitor_tick_waits_for_join_confirmations() -> None:
+    bot = FakeBot()
+    manager = make_manager(["a"], bot)
+    await asyncio.wait_for(manager._monitor_once(), timeout=1)
+    assert [ch.name for ch in bot.connected_channels] == ["a"]
+    assert manager._join_waiters == {}
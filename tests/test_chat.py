@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from twitchio.ext import commands
+
+from bot.twitch import chat as chat_module
+from bot.twitch.chat import ChatSender, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Fake monotonic clock; asyncio.sleep advances it instead of waiting. Returns the sleeps."""
+    state = {"now": 100.0}
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        state["now"] += delay
+
+    monkeypatch.setattr(chat_module.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(chat_module.asyncio, "sleep", fake_sleep)
+    return sleeps
+
+
+async def test_burst_within_capacity_does_not_wait(clock: list[float]) -> None:
+    bucket = TokenBucket(capacity=3, period=30)
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock == []
+
+
+async def test_waits_for_refill_once_empty(clock: list[float]) -> None:
+    bucket = TokenBucket(capacity=3, period=30)
+    for _ in range(4):
+        await bucket.acquire()
+    assert clock == [pytest.approx(10.0)]
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    def get_channel(self, name: str) -> SimpleNamespace:
+        async def send(text: str) -> None:
+            self.sent.append(text)
+
+        return SimpleNamespace(send=send)
+
+
+async def _unused_fallback(text: str) -> None:
+    raise AssertionError("channel was found, fallback must not be used")
+
+
+async def test_queued_messages_are_merged_up_to_max_length() -> None:
+    bot = FakeBot()
+    sender = ChatSender(cast(commands.Bot, bot), TokenBucket(capacity=20, period=30), max_length=9)
+    await asyncio.gather(*(sender.send("chan", text, _unused_fallback) for text in ("aaa", "bbb", "ccc")))
+    assert bot.sent == ["aaa bbb", "ccc"]
+
+
+async def test_full_queue_drops_new_messages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(chat_module, "MAX_QUEUED_MESSAGES", 2)
+    bot = FakeBot()
+    sender = ChatSender(cast(commands.Bot, bot), TokenBucket(capacity=20, period=30), max_length=100)
+    await asyncio.gather(*(sender.send("chan", text, _unused_fallback) for text in ("a", "b", "c")))
+    assert bot.sent == ["a b"]
+
+
+async def test_send_error_reaches_every_merged_caller() -> None:
+    sender = ChatSender(
+        cast(commands.Bot, SimpleNamespace(get_channel=lambda name: None)), TokenBucket(20, 30), 100
+    )
+
+    async def failing_fallback(text: str) -> None:
+        raise ConnectionError("closed")
+
+    results = await asyncio.gather(
+        sender.send("chan", "a", failing_fallback),
+        sender.send("chan", "b", failing_fallback),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+async def test_idle_drain_unregisters_the_channel() -> None:
+    bot = FakeBot()
+    sender = ChatSender(cast(commands.Bot, bot), TokenBucket(capacity=20, period=30), max_length=100)
+    await sender.send("chan", "a", _unused_fallback)
+    await asyncio.sleep(0)
+    assert sender._queues == {} and sender._drains == {}
+    await sender.send("chan", "b", _unused_fallback)
+    assert bot.sent == ["a", "b"]
+
+
+async def test_cancelled_drain_fails_waiting_callers() -> None:
+    bot = FakeBot()
+    sender = ChatSender(cast(commands.Bot, bot), TokenBucket(capacity=20, period=30), max_length=100)
+    pending = asyncio.create_task(sender.send("chan", "a", _unused_fallback))
+    await asyncio.sleep(0)
+    sender._drains["chan"].cancel()
+    with pytest.raises(RuntimeError):
+        await pending
+    assert sender._queues == {}
+    await sender.send("chan", "b", _unused_fallback)
+    assert bot.sent == ["b"]
+
+
+async def test_drain_cancelled_mid_send_fails_its_batch() -> None:
+    blocked = asyncio.Event()
+
+    async def never_sends(text: str) -> None:
+        blocked.set()
+        await asyncio.Event().wait()
+
+    sender = ChatSender(
+        cast(commands.Bot, SimpleNamespace(get_channel=lambda name: SimpleNamespace(send=never_sends))),
+        TokenBucket(20, 30),
+        100,
+    )
+    pending = asyncio.create_task(sender.send("chan", "a", _unused_fallback))
+    await blocked.wait()
+    sender._drains["chan"].cancel()
+    with pytest.raises(RuntimeError):
+        await pending
+    assert sender._drains == {}
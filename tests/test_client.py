@@ -0,0 +1,131 @@
+import asyncio
+from typing import cast
+
+import aiohttp
+import orjson
+import pytest
+
+from bot.hypixel import client as client_module
+from bot.hypixel.client import HypixelClient
+
+OK_BODY = orjson.dumps({"success": True, "mayor": {"name": "Derpy"}})
+
+
+def make_client(responses: list, monkeypatch: pytest.MonkeyPatch) -> tuple[HypixelClient, list[float]]:
+    """Client whose requests return the scripted (status, body, retry_after) tuples or raise."""
+    client = HypixelClient("key", cast(aiohttp.ClientSession, None))
+    sleeps: list[float] = []
+
+    async def fake_get_once(url: str, params: dict[str, str]) -> tuple[int, bytes, str | None]:
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(client, "_get_once", fake_get_once)
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+    return client, sleeps
+
+
+async def test_success_first_try(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, sleeps = make_client([(200, OK_BODY, None)], monkeypatch)
+    assert await client._get_json("url", {}) == {"success": True, "mayor": {"name": "Derpy"}}
+    assert sleeps == []
+
+
+async def test_retries_transient_errors_with_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, sleeps = make_client(
+        [TimeoutError(), (502, b"bad gateway", None), (200, OK_BODY, None)], monkeypatch
+    )
+    assert await client._get_json("url", {}) is not None
+    assert sleeps == [0.5, 1.0]
+
+
+async def test_429_honors_capped_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, sleeps = make_client([(429, b"", "2"), (429, b"", "60"), (200, OK_BODY, None)], monkeypatch)
+    assert await client._get_json("url", {}) is not None
+    assert sleeps == [2.0, client_module.MAX_RETRY_AFTER]
+
+
+async def test_gives_up_after_max_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, sleeps = make_client([(503, b"", None)] * 3, monkeypatch)
+    assert await client._get_json("url", {}) is None
+    assert len(sleeps) == 2
+
+
+async def test_exhausted_retries_open_the_breaker(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: clock["now"])
+    client, _ = make_client([(429, b"", "60")] * 3 + [(200, OK_BODY, None)], monkeypatch)
+    assert await client._get_json("url", {}) is None
+    assert await client._get_json("url", {}) is None  # fails fast, no request sent
+
+    clock["now"] += 60
+    assert await client._get_json("url", {}) is not None
+
+
+async def test_exhausted_timeouts_do_not_open_the_breaker(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, _ = make_client([TimeoutError()] * 3 + [(200, OK_BODY, None)], monkeypatch)
+    assert await client._get_json("url", {}) is None
+    assert await client._get_json("url", {}) is not None
+
+
+async def test_non_retryable_status_and_bad_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, sleeps = make_client([(403, b"forbidden", None), (200, b"not json", None)], monkeypatch)
+    assert await client._get_json("url", {}) is None
+    assert await client._get_json("url", {}) is None
+    assert sleeps == []
+
+
+async def test_expired_mayor_is_served_while_refreshing(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, _ = make_client(
+        [(200, orjson.dumps({"success": True, "mayor": {"name": "Paul"}}), None)], monkeypatch
+    )
+    client._mayor_cache.set("mayor", {"name": "Derpy"})
+    client._mayor_cache.ttl = 0  # expired
+
+    assert await client.get_mayor() == {"name": "Derpy"}
+    refresh = client._in_flight._pending["mayor"]
+    assert await refresh == {"name": "Paul"}
+    assert client._mayor_cache.get_stale("mayor") == {"name": "Paul"}
+
+
+async def test_empty_mayor_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, _ = make_client([(200, orjson.dumps({"success": True}), None)], monkeypatch)
+    assert await client.get_mayor() == {}
+    assert await client.get_mayor() == {}  # no second request scripted
+
+
+async def test_failed_background_mayor_refresh_is_logged(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    client, _ = make_client([], monkeypatch)
+    monkeypatch.setattr(client_module.HypixelClient, "_fetch_mayor", _raising_fetch)
+    client._mayor_cache.set("mayor", {"name": "Derpy"})
+    client._mayor_cache.ttl = 0  # expired
+
+    assert await client.get_mayor() == {"name": "Derpy"}
+    refresh = client._in_flight._pending["mayor"]
+    await asyncio.wait([refresh])
+    assert any(record.exc_info and record.exc_info[0] is ValueError for record in caplog.records)
+
+
+async def _raising_fetch(self: HypixelClient) -> None:
+    raise ValueError("bad election payload")
+
+
+async def test_concurrent_profile_requests_share_one_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = orjson.dumps({"success": True, "profiles": [{"cute_name": "Apple"}]})
+    client, _ = make_client([(200, body, None)], monkeypatch)
+    results = await asyncio.gather(client.get_profiles("uuid"), client.get_profiles("uuid"))
+    assert results == [[{"cute_name": "Apple"}]] * 2
+
+
+async def test_expired_profiles_are_served_on_api_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, _ = make_client([(403, b"forbidden", None)], monkeypatch)
+    client.profiles_cache.set("uuid", [{"cute_name": "Apple"}])
+    client.profiles_cache.ttl = 0  # expired
+    assert await client.get_profiles("uuid") == [{"cute_name": "Apple"}]
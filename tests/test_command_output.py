@@ -1,7 +1,9 @@
 import pytest
 
+from bot.commands.base import REGISTRY, _help_listings, command, help_listing
 from bot.commands.combat import essence, kuudra, slayer
 from bot.commands.dungeons import class_average, dungeon, secrets
+from bot.commands.fun import help_command
 from bot.commands.mining import hotm, nucleus, powder
 from bot.commands.skills import sblvl, skills
 from bot.errors import UserError
@@ -132,3 +134,21 @@ async def test_empty_member_raises_user_error_for_slayer() -> None:
     cc = FakeCommandContext(profile=empty_profile)
     with pytest.raises(UserError, match="has no slayer data"):
         await slayer(cc)
+
+
+async def test_help_lists_visible_commands_only() -> None:
+    cc = make_cc()
+    await help_command(cc)
+    (reply,) = cc.replies
+    assert "#skills" in reply and "#help" in reply
+    assert "#dexter" not in reply and "#dongo" not in reply
+
+
+def test_help_listing_is_rebuilt_after_a_registration() -> None:
+    assert "#zz_test" not in help_listing("#")
+    command("zz_test")(help_command)
+    try:
+        assert help_listing("#").endswith("#zz_test")
+    finally:
+        REGISTRY.pop()
+        _help_listings.clear()
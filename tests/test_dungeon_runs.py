@@ -60,3 +60,13 @@ def test_simulation_single_class() -> None:
     total_runs, active_runs = simulate_class_runs({"mage": 25.0}, active_gain=10.0, passive_gain=2.5)
     assert total_runs == 3
     assert active_runs == {"mage": 3}
+
+
+def test_simulation_finds_fewest_runs() -> None:
+    needs = {"healer": 592.5, "mage": 950.0, "berserk": 21.6, "archer": 1088.9}
+    total_runs, active_runs = simulate_class_runs(needs, active_gain=10.0, passive_gain=2.5)
+    # one run fewer than playing the current bottleneck class every time
+    assert total_runs == 176
+    assert sum(active_runs.values()) == total_runs
+    for name, needed in needs.items():
+        assert active_runs[name] * 10.0 + (total_runs - active_runs[name]) * 2.5 >= needed
@@ -0,0 +1,43 @@
+from bot.commands.dungeons import _latest_run, _parse_participant, _parse_participants
+from bot.format import strip_color_codes
+
+
+def test_strip_color_codes() -> None:
+    assert strip_color_codes("§bSteve§r") == "Steve"
+    assert strip_color_codes("Steve") == "Steve"
+    assert strip_color_codes("trailing§") == "trailing§"
+
+
+def test_parse_participant() -> None:
+    assert _parse_participant("§bAlex: §eMage§b (§e42§b)", "steve") == "Alex (Mage 42)"
+    assert _parse_participant("Alex: Tank (50)", "steve") == "Alex (Tank 50)"
+
+
+def test_parse_participant_skips_target_player() -> None:
+    assert _parse_participant("§bSteve: §eMage§b (§e42§b)", "steve") is None
+
+
+def test_parse_participant_missing_class_info() -> None:
+    assert _parse_participant("§bAlex", "steve") == "Alex (Unknown ?)"
+    assert _parse_participant("Alex: Mage (??)", "steve") == "Alex (Mage ?)"
+
+
+def test_parse_participants_skips_target_and_malformed() -> None:
+    participants = [
+        {"display_name": "§bSteve: §eMage§b (§e42§b)"},
+        {"display_name": "§aAlex: §eTank§a (§e50§a)"},
+        {"display_name": ""},
+        "not a dict",
+        {"display_name": 42},
+        {},
+        {"display_name": "§cNotch: §eHealer§c (§e7§c)"},
+    ]
+    assert _parse_participants(participants, "steve") == ["Alex (Tank 50)", "Notch (Healer 7)"]
+
+
+def test_latest_run_skips_malformed_entries() -> None:
+    # a non-numeric timestamp must rank as 0, not break the comparison
+    runs = [{"completion_ts": 5}, "junk", {"completion_ts": None}, {"completion_ts": "x"}]
+    runs.append({"completion_ts": 9})
+    assert _latest_run(runs) is runs[-1]
+    assert _latest_run([]) is None
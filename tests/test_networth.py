@@ -0,0 +1,18 @@
+import logging
+from types import SimpleNamespace
+from typing import cast
+
+import aiohttp
+import pytest
+
+from bot.services.networth import NetworthClient
+
+
+async def test_bare_timeout_is_logged_by_name(caplog: pytest.LogCaptureFixture) -> None:
+    def post(*args: object, **kwargs: object) -> None:
+        raise TimeoutError()
+
+    client = NetworthClient("http://networth", cast(aiohttp.ClientSession, SimpleNamespace(post=post)))
+    with caplog.at_level(logging.ERROR):
+        assert await client.calculate("uuid", {}, None, 0) is None
+    assert caplog.messages == ["failed to reach networth service: TimeoutError"]
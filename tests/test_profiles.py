@@ -1,4 +1,6 @@
-from bot.hypixel.profiles import select_profile
+from typing import Any, cast
+
+from bot.hypixel.profiles import ProfileService, build_name_index, dig, select_profile
 
 UUID = "abc123"
 OTHER_UUID = "other456"
@@ -48,3 +50,32 @@ def test_last_save_fallback_without_selected_flag() -> None:
 def test_no_matching_profile_returns_none() -> None:
     assert select_profile([CHERRY_NOT_MEMBER], UUID, None) is None
     assert select_profile([], UUID, None) is None
+
+
+def test_prebuilt_name_index_is_used() -> None:
+    index = build_name_index(PROFILES)
+    assert select_profile(PROFILES, UUID, "Apple", index) is APPLE
+    assert select_profile(PROFILES, UUID, "Apple", {}) is BANANA_SELECTED
+
+
+def test_single_profile_needs_no_last_save() -> None:
+    profile = {"cute_name": "Zucchini", "members": {UUID: {}}}
+    assert select_profile([profile], UUID, None) is profile
+
+
+def test_dig() -> None:
+    data = {"dungeons": {"dungeon_types": {"catacombs": {"experience": 50}}, "treasures": None}}
+    assert dig(data, "dungeons", "dungeon_types", "catacombs", "experience") == 50
+    assert dig(data, "dungeons", "dungeon_types", "master_catacombs", "experience", default=0) == 0
+    assert dig(data, "dungeons", "treasures", "runs", default=[]) == []
+    assert dig(data, "dungeons", "dungeon_types", "catacombs", "experience", "x", default=-1) == -1
+
+
+def test_resolve_ign() -> None:
+    links = {"viewer": "LinkedIgn"}
+    service = ProfileService(cast(Any, None), cast(Any, None), cast(Any, links))
+    assert service.resolve_ign("@Steve ", "viewer") == "Steve"
+    assert service.resolve_ign(None, "viewer") == "LinkedIgn"
+    assert service.resolve_ign("@", "viewer") == "LinkedIgn"
+    assert service.resolve_ign("@Viewer", "viewer") == "LinkedIgn"
+    assert service.resolve_ign("  ", "other") == "other"
@@ -0,0 +1,42 @@
+import pytest
+
+from bot.hypixel import ratelimit as ratelimit_module
+from bot.hypixel.ratelimit import RateLimitBudget
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> dict[str, float]:
+    state = {"now": 1000.0}
+    monkeypatch.setattr(ratelimit_module.time, "monotonic", lambda: state["now"])
+    return state
+
+
+def test_unknown_budget_never_waits() -> None:
+    budget = RateLimitBudget()
+    budget.spend()
+    assert budget.wait_time() == 0.0
+
+
+def test_waits_for_reset_once_spent(clock: dict[str, float]) -> None:
+    budget = RateLimitBudget()
+    budget.update({"RateLimit-Remaining": "1", "RateLimit-Reset": "30"})
+    assert budget.wait_time() == 0.0
+    budget.spend()
+    assert budget.wait_time() == 30.0
+    clock["now"] += 30
+    assert budget.wait_time() == 0.0
+
+
+def test_window_rollover_forgets_old_budget(clock: dict[str, float]) -> None:
+    budget = RateLimitBudget()
+    budget.update({"RateLimit-Remaining": "0", "RateLimit-Reset": "10"})
+    clock["now"] += 11
+    budget.spend()
+    assert budget.wait_time() == 0.0
+
+
+def test_ignores_missing_or_bad_headers() -> None:
+    budget = RateLimitBudget()
+    budget.update({"RateLimit-Remaining": "soon", "RateLimit-Reset": "10"})
+    budget.update({})
+    assert budget.wait_time() == 0.0
@@ -0,0 +1,72 @@
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+import aiohttp
+import pytest
+
+from bot.twitch.streams import StreamScanner
+
+
+async def test_live_streamers_are_reused_within_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    scanner = StreamScanner("id", "secret", cast(aiohttp.ClientSession, None))
+    scans: list[None] = []
+
+    async def fake_scan() -> list[str] | None:
+        scans.append(None)
+        return ["steve"] if len(scans) > 1 else None
+
+    monkeypatch.setattr(scanner, "_scan_live_skyblock_streamers", fake_scan)
+    assert await scanner.fetch_live_skyblock_streamers() is None  # failures are not cached
+    assert await scanner.fetch_live_skyblock_streamers() == ["steve"]
+    assert await scanner.fetch_live_skyblock_streamers() == ["steve"]
+    assert len(scans) == 2
+
+
+async def test_concurrent_scans_share_one_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    scanner = StreamScanner("id", "secret", cast(aiohttp.ClientSession, None))
+    scans: list[None] = []
+
+    async def fake_scan() -> list[str] | None:
+        scans.append(None)
+        await asyncio.sleep(0)
+        return ["steve"]
+
+    monkeypatch.setattr(scanner, "_scan_live_skyblock_streamers", fake_scan)
+    results = await asyncio.gather(
+        scanner.fetch_live_skyblock_streamers(), scanner.fetch_live_skyblock_streamers()
+    )
+    assert results == [["steve"], ["steve"]]
+    assert len(scans) == 1
+
+
+class FakeTokenResponse:
+    status = 200
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    async def __aenter__(self) -> "FakeTokenResponse":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def json(self, loads: object = None) -> dict:
+        return self._data
+
+
+async def test_access_token_is_reused_until_expiry() -> None:
+    posts: list[str] = []
+
+    def post(url: str, data: dict) -> FakeTokenResponse:
+        posts.append(url)
+        return FakeTokenResponse({"access_token": f"token{len(posts)}", "expires_in": 3600})
+
+    scanner = StreamScanner("id", "secret", cast(aiohttp.ClientSession, SimpleNamespace(post=post)))
+    assert await scanner._get_access_token() == "token1"
+    assert await scanner._get_access_token() == "token1"
+    assert len(posts) == 1
+
+    scanner._token_expires_at = 0.0
+    assert await scanner._get_access_token() == "token2"